@@ -1,100 +1,182 @@
 """
 INDUSTRY Layer - 한국 시장 섹터/업종 분석
 """
-import yfinance as yf
+import dbm
+import hashlib
+import heapq
 import json
+import os
+import shelve
+import time
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
 from config import CLAUDE_API_KEY
+from json_utils import dumps, parse_json_response
+from market_data import FETCH_ERRORS, download_history
+
+try:
+    import anthropic
+except ImportError:
+    anthropic = None
+
+# Claude 분석 디스크 캐시 (30분 TTL, 최근 32건 유지)
+ANALYSIS_CACHE_DIR = ".analysis_cache"
+ANALYSIS_CACHE_TTL = 1800
+ANALYSIS_CACHE_SIZE = 32
+_CACHE_ERRORS = (OSError,) + dbm.error
+
+
+def _analysis_key(kr_data: List[Dict], us_data: List[Dict], macro: Dict) -> str:
+    """입력 스냅샷 해시 (동일 프롬프트 판별용)"""
+    payload = json.dumps([kr_data, us_data, macro], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _load_analysis(key: str) -> Optional[Dict]:
+    try:
+        with shelve.open(os.path.join(ANALYSIS_CACHE_DIR, "industry")) as db:
+            entry = db.get(key)
+    except _CACHE_ERRORS:
+        return None
+    if entry and time.time() - entry[0] < ANALYSIS_CACHE_TTL:
+        return entry[1]
+    return None
+
+
+def _store_analysis(key: str, result: Dict) -> None:
+    try:
+        os.makedirs(ANALYSIS_CACHE_DIR, exist_ok=True)
+        with shelve.open(os.path.join(ANALYSIS_CACHE_DIR, "industry")) as db:
+            now = time.time()
+            db[key] = (now, result)
+            # 만료 항목 제거 후 최신 순으로 최대 개수만 유지
+            stamps = sorted(((db[k][0], k) for k in db.keys()), reverse=True)
+            for i, (ts, k) in enumerate(stamps):
+                if i >= ANALYSIS_CACHE_SIZE or now - ts >= ANALYSIS_CACHE_TTL:
+                    del db[k]
+    except _CACHE_ERRORS:
+        pass
+
+
+def _format_perf_lines(sectors: List[Dict]) -> str:
+    """프롬프트용 업종 퍼포먼스 목록"""
+    return "\n".join(
+        f"- {s['name']}: 주간 {s['perf_week']:+.1f}%, 월간 {s['perf_month']:+.1f}%"
+        for s in sectors
+    )
+
+
+# 한국 업종 대표 ETF/종목 (업종명, 티커)
+_KR_SECTORS = (
+    ("반도체", ("005930.KS", "000660.KS")),  # 삼성전자, SK하이닉스
+    ("2차전지", ("373220.KS", "006400.KS")),  # LG에너지솔루션, 삼성SDI
+    ("바이오", ("207940.KS", "068270.KS")),  # 삼성바이오로직스, 셀트리온
+    ("자동차", ("005380.KS", "000270.KS")),  # 현대차, 기아
+    ("조선", ("009540.KS", "010140.KS")),  # 한국조선해양, 삼성중공업
+    ("금융", ("105560.KS", "055550.KS")),  # KB금융, 신한지주
+    ("철강", ("005490.KS",)),  # POSCO홀딩스
+    ("화학", ("051910.KS", "010950.KS")),  # LG화학, S-Oil
+    ("유통", ("004170.KS", "139480.KS")),  # 신세계, 이마트
+    ("통신", ("017670.KS", "030200.KS")),  # SK텔레콤, KT
+    ("엔터", ("352820.KS", "041510.KS")),  # 하이브, SM
+    ("게임", ("036570.KS", "251270.KS")),  # 엔씨소프트, 넷마블
+)
+
+# 미국 섹터 ETF (글로벌 비교용)
+_US_SECTORS = (
+    ("Technology", "XLK"),
+    ("Semiconductor", "SOXX"),
+    ("Healthcare", "XLV"),
+    ("Financial", "XLF"),
+    ("Energy", "XLE"),
+    ("Industrial", "XLI"),
+    ("Consumer", "XLY"),
+)
 
 
 class IndustryAnalyzer:
     """한국 시장 업종 분석"""
     
+    __slots__ = ("kr_sectors", "us_sectors", "_claude")
+    
     def __init__(self):
-        # 한국 업종 대표 ETF/종목
-        self.kr_sectors = {
-            "반도체": ["005930.KS", "000660.KS"],  # 삼성전자, SK하이닉스
-            "2차전지": ["373220.KS", "006400.KS"],  # LG에너지솔루션, 삼성SDI
-            "바이오": ["207940.KS", "068270.KS"],  # 삼성바이오로직스, 셀트리온
-            "자동차": ["005380.KS", "000270.KS"],  # 현대차, 기아
-            "조선": ["009540.KS", "010140.KS"],  # 한국조선해양, 삼성중공업
-            "금융": ["105560.KS", "055550.KS"],  # KB금융, 신한지주
-            "철강": ["005490.KS"],  # POSCO홀딩스
-            "화학": ["051910.KS", "010950.KS"],  # LG화학, S-Oil
-            "유통": ["004170.KS", "139480.KS"],  # 신세계, 이마트
-            "통신": ["017670.KS", "030200.KS"],  # SK텔레콤, KT
-            "엔터": ["352820.KS", "041510.KS"],  # 하이브, SM
-            "게임": ["036570.KS", "251270.KS"],  # 엔씨소프트, 넷마블
-        }
+        # Claude 클라이언트 - 첫 호출 시 생성 후 재사용 (HTTP 연결 유지)
+        self._claude = None
         
-        # 미국 섹터 ETF (글로벌 비교용)
-        self.us_sectors = {
-            "Technology": "XLK",
-            "Semiconductor": "SOXX",
-            "Healthcare": "XLV",
-            "Financial": "XLF",
-            "Energy": "XLE",
-            "Industrial": "XLI",
-            "Consumer": "XLY",
-        }
+        self.kr_sectors = _KR_SECTORS
+        self.us_sectors = _US_SECTORS
+    
+    def _ticker_perf(self, hist: pd.DataFrame) -> Optional[Tuple[float, float]]:
+        """히스토리 → (주간, 월간) 수익률"""
+        try:
+            if len(hist) >= 2:
+                closes = hist['Close'].to_numpy()
+                latest = closes[-1]
+                month_ago = closes[0]
+                week_ago = closes[-5] if closes.size >= 5 else month_ago
+                return (
+                    (latest - week_ago) / week_ago * 100,
+                    (latest - month_ago) / month_ago * 100,
+                )
+        except FETCH_ERRORS:
+            pass
+        return None
     
-    def fetch_kr_sector(self, name: str, tickers: List[str]) -> Dict:
-        """한국 업종 데이터"""
-        perfs = []
+    def fetch_kr_sector(self, name: str, tickers: List[str],
+                        histories: Dict[str, pd.DataFrame] = None) -> Dict:
+        """
+        한국 업종 데이터
+        
+        Args:
+            histories: 배치 다운로드 결과 {티커: DataFrame} (없으면 직접 조회)
+        """
+        if histories is None:
+            histories = download_history(tickers)
+        
+        # 종목별 (주간, 월간) 수익률을 연속 버퍼에 누적 후 한 번에 평균
+        perf_arr = np.empty((len(tickers), 2), dtype=np.float64)
+        n = 0
         for ticker in tickers:
-            try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period="1mo")
-                if len(hist) >= 2:
-                    latest = hist['Close'].iloc[-1]
-                    month_ago = hist['Close'].iloc[0]
-                    week_ago = hist['Close'].iloc[-5] if len(hist) >= 5 else month_ago
-                    perfs.append({
-                        "week": ((latest - week_ago) / week_ago * 100),
-                        "month": ((latest - month_ago) / month_ago * 100),
-                    })
-            except:
-                pass
+            perf = self._ticker_perf(histories[ticker])
+            if perf:
+                perf_arr[n] = perf
+                n += 1
         
-        if perfs:
-            avg_week = sum(p["week"] for p in perfs) / len(perfs)
-            avg_month = sum(p["month"] for p in perfs) / len(perfs)
+        if n:
+            avg_week, avg_month = perf_arr[:n].mean(axis=0)
             return {"name": name, "perf_week": avg_week, "perf_month": avg_month}
         return {"name": name, "perf_week": 0, "perf_month": 0}
     
-    def fetch_us_sector(self, name: str, ticker: str) -> Dict:
-        """미국 섹터 데이터"""
-        try:
-            etf = yf.Ticker(ticker)
-            hist = etf.history(period="1mo")
-            if len(hist) >= 2:
-                latest = hist['Close'].iloc[-1]
-                month_ago = hist['Close'].iloc[0]
-                week_ago = hist['Close'].iloc[-5] if len(hist) >= 5 else month_ago
-                return {
-                    "name": name,
-                    "perf_week": ((latest - week_ago) / week_ago * 100),
-                    "perf_month": ((latest - month_ago) / month_ago * 100),
-                }
-        except:
-            pass
+    def fetch_us_sector(self, name: str, ticker: str, hist: pd.DataFrame = None) -> Dict:
+        """미국 섹터 데이터 (hist: 배치 다운로드 결과, 없으면 직접 조회)"""
+        if hist is None:
+            hist = download_history([ticker])[ticker]
+        
+        perf = self._ticker_perf(hist)
+        if perf:
+            return {"name": name, "perf_week": perf[0], "perf_month": perf[1]}
         return {"name": name, "perf_week": 0, "perf_month": 0}
 
     
     def analyze_with_claude(self, kr_data: List[Dict], us_data: List[Dict], macro: Dict) -> Dict:
         """Claude로 업종 분석"""
         try:
-            from config import CLAUDE_API_KEY
-            import anthropic
-            
-            if not CLAUDE_API_KEY:
+            if anthropic is None or not CLAUDE_API_KEY:
                 return self._basic_analysis(kr_data, us_data, macro)
             
-            claude = anthropic.Anthropic(api_key=CLAUDE_API_KEY)
+            # 동일 입력은 TTL 내 캐시된 분석 재사용 (API 왕복 생략)
+            cache_key = _analysis_key(kr_data, us_data, macro)
+            cached = _load_analysis(cache_key)
+            if cached is not None:
+                return cached
             
-            kr_text = "\n".join([f"- {s['name']}: 주간 {s['perf_week']:+.1f}%, 월간 {s['perf_month']:+.1f}%" for s in kr_data])
-            us_text = "\n".join([f"- {s['name']}: 주간 {s['perf_week']:+.1f}%, 월간 {s['perf_month']:+.1f}%" for s in us_data])
+            if self._claude is None:
+                self._claude = anthropic.Anthropic(api_key=CLAUDE_API_KEY)
+            
+            kr_text = _format_perf_lines(kr_data)
+            us_text = _format_perf_lines(us_data)
             
             prompt = f"""한국 증시 섹터 애널리스트로서 분석해주세요.
 
@@ -121,21 +203,15 @@ JSON으로 응답:
 "trading_idea": "구체적인 트레이딩 아이디어 (2-3문장)",
 "foreign_flow_outlook": "외국인 수급 전망 (1-2문장)"}}"""
 
-            msg = claude.messages.create(
+            msg = self._claude.messages.create(
                 model="claude-sonnet-4-20250514",
                 max_tokens=2000,
                 messages=[{"role": "user", "content": prompt}]
             )
             
-            text = msg.content[0].text
-            if "```" in text:
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-                text = text.split("```")[0]
-            
-            result = json.loads(text.strip())
+            result = parse_json_response(msg.content[0].text)
             result["source"] = "claude"
+            _store_analysis(cache_key, result)
             return result
         except Exception as e:
             print(f"    ⚠️ Claude 오류: {e}")
@@ -143,22 +219,24 @@ JSON으로 응답:
     
     def _basic_analysis(self, kr_data: List[Dict], us_data: List[Dict], macro: Dict) -> Dict:
         """기본 분석"""
-        sorted_kr = sorted(kr_data, key=lambda x: x["perf_month"], reverse=True)
+        # 상위/하위 3개만 사용하므로 전체 정렬 대신 힙 선택
+        top3 = heapq.nlargest(3, kr_data, key=lambda x: x["perf_month"])
+        bottom3 = heapq.nsmallest(3, kr_data, key=lambda x: x["perf_month"])[::-1]
         return {
             "market_cycle": "MID_EXPANSION",
             "cycle_reasoning": "퍼포먼스 기반 분석",
             "top_sectors": [
                 {"name": s["name"], "score": 80-i*5, "reasoning": f"월간 {s['perf_month']:+.1f}% 상승", "catalysts": [], "target_stocks": []}
-                for i, s in enumerate(sorted_kr[:3])
+                for i, s in enumerate(top3)
             ],
             "avoid_sectors": [
                 {"name": s["name"], "score": 30+i*5, "reasoning": f"월간 {s['perf_month']:+.1f}%", "risks": []}
-                for i, s in enumerate(sorted_kr[-3:])
+                for i, s in enumerate(bottom3)
             ],
             "rotation_signal": "NEUTRAL",
             "key_themes": ["모멘텀"],
             "policy_impact": "기본 분석",
-            "trading_idea": f"상위 업종 {sorted_kr[0]['name']} 주목",
+            "trading_idea": f"상위 업종 {top3[0]['name']} 주목",
             "foreign_flow_outlook": "",
             "source": "basic"
         }
@@ -168,18 +246,22 @@ JSON으로 응답:
         if macro_data is None:
             macro_data = {"overall": "NEUTRAL", "indicators": {}}
         
-        print("    → 한국 업종 데이터 수집 중...")
-        kr_data = []
-        for name, tickers in self.kr_sectors.items():
-            data = self.fetch_kr_sector(name, tickers)
-            kr_data.append(data)
+        print("    → 한국/미국 업종 데이터 수집 중...")
+        # 전체 티커를 한 번의 배치 요청으로 다운로드 (티커별 HTTP 왕복 제거)
+        all_tickers = [t for _, tickers in _KR_SECTORS for t in tickers]
+        all_tickers += [ticker for _, ticker in _US_SECTORS]
+        histories = download_history(all_tickers, period="1mo")
+        
+        kr_data = [
+            self.fetch_kr_sector(name, tickers, histories)
+            for name, tickers in _KR_SECTORS
+        ]
         kr_data.sort(key=lambda x: x["perf_month"], reverse=True)
         
-        print("    → 미국 섹터 데이터 수집 중...")
-        us_data = []
-        for name, ticker in self.us_sectors.items():
-            data = self.fetch_us_sector(name, ticker)
-            us_data.append(data)
+        us_data = [
+            self.fetch_us_sector(name, ticker, histories[ticker])
+            for name, ticker in _US_SECTORS
+        ]
         us_data.sort(key=lambda x: x["perf_month"], reverse=True)
         
         print("    → Claude 업종 분석 중...")
@@ -196,4 +278,4 @@ JSON으로 응답:
 if __name__ == "__main__":
     analyzer = IndustryAnalyzer()
     result = analyzer.analyze()
-    print(json.dumps(result, indent=2, ensure_ascii=False))
\ No newline at end of file
+    print(dumps(result))
\ No newline at end of file
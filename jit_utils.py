@@ -0,0 +1,15 @@
+"""
+Numba JIT 호환 모듈 - numba가 없으면 순수 Python/NumPy로 동작
+"""
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """numba.njit 대체 - 함수를 그대로 반환 (@njit, @njit(...) 모두 지원)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
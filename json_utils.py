@@ -0,0 +1,44 @@
+"""
+JSON 공통 모듈 - Claude 응답 JSON 추출, orjson이 있으면 orjson으로 (역)직렬화
+"""
+import json
+import re
+from typing import Dict
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Claude 응답에서 ```json ... ``` 블록 추출
+FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+
+if ORJSON_AVAILABLE:
+    # bytes/str 모두 입력 가능
+    loads = orjson.loads
+
+    def dumps(obj) -> str:
+        """사람이 읽는 출력용 JSON (들여쓰기 2칸, UTF-8 그대로)"""
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode("utf-8")
+else:
+    loads = json.loads
+
+    def dumps(obj) -> str:
+        """사람이 읽는 출력용 JSON (들여쓰기 2칸, UTF-8 그대로)"""
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def parse_json_response(text: str) -> Dict:
+    """Claude 응답 텍스트 → JSON 객체 (코드 펜스 유무 모두 처리)"""
+    m = FENCE_RE.search(text)
+    if m:
+        return loads(m.group(1))
+    # 펜스가 없으면 첫 '{'부터 객체 끝까지만 디코딩
+    start = text.find("{")
+    if start < 0:
+        raise ValueError("JSON 객체를 찾을 수 없음")
+    return _JSON_DECODER.raw_decode(text, start)[0]
@@ -1,68 +1,206 @@
 """
 MACRO Layer - 한국/미국 시장 거시경제 지표 + 상관관계 분석
 """
-import yfinance as yf
+import copy
+import warnings
 import numpy as np
+import pandas as pd
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, List
+from jit_utils import njit
+from market_data import FETCH_ERRORS, download_history
+
+
+# 종합 판단용 시그널 분류
+_POSITIVE_SIGNALS = frozenset(("POSITIVE", "RISK_ON"))
+_NEGATIVE_SIGNALS = frozenset(("NEGATIVE", "RISK_OFF"))
+
+@njit(cache=True)
+def _extract_pairs(corr):
+    """상관행렬 상삼각 (i, j, 값) 추출"""
+    n = corr.shape[0]
+    size = n * (n - 1) // 2
+    idx_i = np.empty(size, dtype=np.int64)
+    idx_j = np.empty(size, dtype=np.int64)
+    vals = np.empty(size, dtype=np.float64)
+    k = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            idx_i[k] = i
+            idx_j[k] = j
+            vals[k] = corr[i, j]
+            k += 1
+    return idx_i, idx_j, vals
+
+
+@njit(cache=True)
+def _extract_row(corr, row):
+    """상관행렬 한 행에서 자기 자신을 제외한 (j, 값) 추출"""
+    n = corr.shape[0]
+    idx = np.empty(n - 1, dtype=np.int64)
+    vals = np.empty(n - 1, dtype=np.float64)
+    k = 0
+    for j in range(n):
+        if j != row:
+            idx[k] = j
+            vals[k] = corr[row, j]
+            k += 1
+    return idx, vals
+
+
+# 한국 금리 (한국은행 기준금리 + 국고채)
+# 한국 금리는 yfinance에서 직접 제공하지 않음
+# 실제 운영시에는 한국은행 API나 금융투자협회 API 연동 필요
+# 현재는 최근 데이터 기준 추정치 사용 (호출마다 새로 만들 필요 없는 상수)
+#
+# 2026년 2월 기준 추정 (실제로는 API 연동 필요)
+# 한국은행 기준금리: 3.00% (2024년 10월 인하 후)
+# 국고채 3년: 약 2.8~3.0%
+# 국고채 10년: 약 3.0~3.2%
+# (읽기 전용 - fetch_korea_rates는 호출마다 복사본 반환)
+_KOREA_RATES = MappingProxyType({
+    "bok_base": MappingProxyType({
+        "value": 3.00,
+        "prev": 3.00,
+        "change": 0.0,
+        "change_pct": 0.0,
+        "description": "한국은행 기준금리"
+    }),
+    "kr_3y": MappingProxyType({
+        "value": 2.85,
+        "prev": 2.90,
+        "change": -0.05,
+        "change_pct": -1.72,
+        "description": "국고채 3년"
+    }),
+    "kr_10y": MappingProxyType({
+        "value": 3.05,
+        "prev": 3.10,
+        "change": -0.05,
+        "change_pct": -1.61,
+        "description": "국고채 10년"
+    }),
+    "kr_spread": MappingProxyType({
+        "value": 0.20,  # 10년 - 3년
+        "description": "국고채 10Y-3Y 스프레드"
+    }),
+    "kr_us_spread": MappingProxyType({
+        "value": -1.22,  # 한국 10년 - 미국 10년 (역전 상태)
+        "description": "한미 금리차 (10Y)"
+    }),
+})
+
+
+@lru_cache(maxsize=1)
+def _weekly_calendar(year: int, week: int) -> Dict:
+    """ISO (연도, 주차)별 경제 캘린더 - 같은 주에는 캐시된 결과 반환"""
+    week_start = datetime.fromisocalendar(year, week, 1)
+    
+    # 샘플 캘린더 (실제로는 경제 캘린더 API 연동)
+    us_events = [
+        {"date": (week_start + timedelta(days=1)).strftime("%m/%d"), "event": "ISM 제조업 PMI", "importance": "HIGH"},
+        {"date": (week_start + timedelta(days=2)).strftime("%m/%d"), "event": "ADP 고용보고서", "importance": "MEDIUM"},
+        {"date": (week_start + timedelta(days=3)).strftime("%m/%d"), "event": "ISM 서비스업 PMI", "importance": "HIGH"},
+        {"date": (week_start + timedelta(days=4)).strftime("%m/%d"), "event": "비농업 고용지표 (NFP)", "importance": "HIGH"},
+        {"date": (week_start + timedelta(days=4)).strftime("%m/%d"), "event": "실업률", "importance": "HIGH"},
+    ]
+    
+    kr_events = [
+        {"date": (week_start + timedelta(days=0)).strftime("%m/%d"), "event": "수출입 동향", "importance": "HIGH"},
+        {"date": (week_start + timedelta(days=2)).strftime("%m/%d"), "event": "소비자물가지수 (CPI)", "importance": "HIGH"},
+        {"date": (week_start + timedelta(days=3)).strftime("%m/%d"), "event": "금융통화위원회", "importance": "HIGH"},
+    ]
+    
+    earnings = [
+        {"date": (week_start + timedelta(days=1)).strftime("%m/%d"), "company": "삼성전자", "market": "KR"},
+        {"date": (week_start + timedelta(days=2)).strftime("%m/%d"), "company": "Apple", "market": "US"},
+        {"date": (week_start + timedelta(days=2)).strftime("%m/%d"), "company": "Amazon", "market": "US"},
+        {"date": (week_start + timedelta(days=3)).strftime("%m/%d"), "company": "SK하이닉스", "market": "KR"},
+    ]
+    
+    return {
+        "week_of": week_start.strftime("%Y-%m-%d"),
+        "us_events": us_events,
+        "kr_events": kr_events,
+        "earnings": earnings,
+    }
+
+
+# 매크로 지표 티커 (키 조회용, 읽기 전용)
+_MACRO_TICKERS = MappingProxyType({
+    # 한국 시장
+    "kospi": "^KS11",
+    "kosdaq": "^KQ11",
+    # 미국 시장
+    "sp500": "^GSPC",
+    "nasdaq": "^IXIC",
+    "dow": "^DJI",
+    "russell": "^RUT",
+    # 금리/채권
+    "us_10y": "^TNX",
+    "us_2y": "^IRX",
+    "us_30y": "^TYX",
+    # 변동성
+    "vix": "^VIX",
+    # 환율
+    "usdkrw": "KRW=X",
+    "dxy": "DX-Y.NYB",
+    "eurusd": "EURUSD=X",
+    "usdjpy": "JPY=X",
+    # 원자재
+    "gold": "GC=F",
+    "silver": "SI=F",
+    "oil": "CL=F",
+    "copper": "HG=F",
+    "natgas": "NG=F",
+    # 크립토
+    "btc": "BTC-USD",
+    "eth": "ETH-USD",
+})
+
+# analyze()에서 순회하는 (키, 티커) 쌍 - 금리는 일간, 나머지는 주간 데이터
+_RATE_TICKERS = tuple((k, _MACRO_TICKERS[k]) for k in ("us_10y", "us_2y", "us_30y"))
+_WEEKLY_TICKERS = tuple((k, _MACRO_TICKERS[k]) for k in (
+    "kospi", "kosdaq", "sp500", "nasdaq", "dow", "russell",
+    "vix", "usdkrw", "dxy", "eurusd", "usdjpy",
+    "gold", "silver", "oil", "copper", "btc", "eth",
+))
+
+# 상관관계 분석용 주요 자산 (이름, 티커)
+_CORRELATION_ASSETS = (
+    ("KOSPI", "^KS11"),
+    ("S&P500", "^GSPC"),
+    ("NASDAQ", "^IXIC"),
+    ("US10Y", "^TNX"),
+    ("DXY", "DX-Y.NYB"),
+    ("Gold", "GC=F"),
+    ("Oil", "CL=F"),
+    ("VIX", "^VIX"),
+    ("BTC", "BTC-USD"),
+)
 
 
 class MacroAnalyzer:
     """거시경제 분석 + 자산간 상관관계"""
     
+    __slots__ = ("tickers", "correlation_assets")
+    
     def __init__(self):
-        self.tickers = {
-            # 한국 시장
-            "kospi": "^KS11",
-            "kosdaq": "^KQ11",
-            # 미국 시장
-            "sp500": "^GSPC",
-            "nasdaq": "^IXIC",
-            "dow": "^DJI",
-            "russell": "^RUT",
-            # 금리/채권
-            "us_10y": "^TNX",
-            "us_2y": "^IRX",
-            "us_30y": "^TYX",
-            # 변동성
-            "vix": "^VIX",
-            # 환율
-            "usdkrw": "KRW=X",
-            "dxy": "DX-Y.NYB",
-            "eurusd": "EURUSD=X",
-            "usdjpy": "JPY=X",
-            # 원자재
-            "gold": "GC=F",
-            "silver": "SI=F",
-            "oil": "CL=F",
-            "copper": "HG=F",
-            "natgas": "NG=F",
-            # 크립토
-            "btc": "BTC-USD",
-            "eth": "ETH-USD",
-        }
-        
-        # 상관관계 분석용 주요 자산
-        self.correlation_assets = {
-            "KOSPI": "^KS11",
-            "S&P500": "^GSPC",
-            "NASDAQ": "^IXIC",
-            "US10Y": "^TNX",
-            "DXY": "DX-Y.NYB",
-            "Gold": "GC=F",
-            "Oil": "CL=F",
-            "VIX": "^VIX",
-            "BTC": "BTC-USD",
-        }
+        self.tickers = _MACRO_TICKERS
+        self.correlation_assets = _CORRELATION_ASSETS
     
-    def fetch_data(self, ticker: str, period: str = "5d") -> Dict:
+    def fetch_data(self, ticker: str, period: str = "5d", hist: pd.DataFrame = None) -> Dict:
+        """일간 데이터 (hist: 배치 다운로드 결과, 없으면 직접 조회)"""
         try:
-            data = yf.Ticker(ticker)
-            hist = data.history(period=period)
+            if hist is None:
+                hist = download_history([ticker], period=period)[ticker]
             if len(hist) >= 2:
-                latest = float(hist['Close'].iloc[-1])
-                prev = float(hist['Close'].iloc[-2])
-                week_ago = float(hist['Close'].iloc[0]) if len(hist) >= 5 else prev
+                closes = hist['Close'].to_numpy()
+                latest = float(closes[-1])
+                prev = float(closes[-2])
+                week_ago = float(closes[0]) if closes.size >= 5 else prev
                 return {
                     "value": latest,
                     "prev": prev,
@@ -70,21 +208,22 @@ class MacroAnalyzer:
                     "change_pct": ((latest - prev) / prev * 100) if prev else 0,
                     "week_change_pct": ((latest - week_ago) / week_ago * 100) if week_ago else 0,
                 }
-        except:
+        except FETCH_ERRORS:
             pass
         return {"value": 0, "prev": 0, "change": 0, "change_pct": 0, "week_change_pct": 0}
     
-    def fetch_weekly_data(self, ticker: str) -> Dict:
-        """주간 데이터 (1개월치)"""
+    def fetch_weekly_data(self, ticker: str, hist: pd.DataFrame = None) -> Dict:
+        """주간 데이터 (1개월치, hist: 배치 다운로드 결과)"""
         try:
-            data = yf.Ticker(ticker)
-            hist = data.history(period="1mo")
+            if hist is None:
+                hist = download_history([ticker], period="1mo")[ticker]
             if len(hist) >= 5:
-                latest = float(hist['Close'].iloc[-1])
-                week_ago = float(hist['Close'].iloc[-5]) if len(hist) >= 5 else latest
-                month_ago = float(hist['Close'].iloc[0])
-                high = float(hist['High'].max())
-                low = float(hist['Low'].min())
+                closes = hist['Close'].to_numpy()
+                latest = float(closes[-1])
+                week_ago = float(closes[-5])
+                month_ago = float(closes[0])
+                high = float(np.nanmax(hist['High'].to_numpy()))
+                low = float(np.nanmin(hist['Low'].to_numpy()))
                 return {
                     "value": latest,
                     "week_ago": week_ago,
@@ -95,52 +234,98 @@ class MacroAnalyzer:
                     "low_1m": low,
                     "range_pct": ((high - low) / low * 100) if low else 0,
                 }
-        except:
+        except FETCH_ERRORS:
             pass
         return {"value": 0, "week_change_pct": 0, "month_change_pct": 0, "high_1m": 0, "low_1m": 0, "range_pct": 0}
     
+    def fetch_weekly_batch(self, tickers: List[str], histories: Dict[str, pd.DataFrame]) -> Dict[str, Dict]:
+        """주간 데이터 일괄 계산 - (T, N) 종가/고가/저가 행렬에서 한 번에 벡터 연산"""
+        empty = {"value": 0, "week_change_pct": 0, "month_change_pct": 0, "high_1m": 0, "low_1m": 0, "range_pct": 0}
+        lengths = np.array([len(histories[t]) for t in tickers], dtype=np.int64)
+        valid = lengths >= 5
+        if not valid.any():
+            return {t: dict(empty) for t in tickers}
+        
+        # 티커별 거래일 수가 달라 최신 행 기준으로 우측 정렬 (빈 칸은 NaN)
+        n_rows = int(lengths.max())
+        close = np.full((n_rows, len(tickers)), np.nan)
+        high = np.full_like(close, np.nan)
+        low = np.full_like(close, np.nan)
+        for j, t in enumerate(tickers):
+            if valid[j]:
+                hist = histories[t]
+                close[-lengths[j]:, j] = hist['Close'].to_numpy()
+                high[-lengths[j]:, j] = hist['High'].to_numpy()
+                low[-lengths[j]:, j] = hist['Low'].to_numpy()
+        
+        cols = np.arange(len(tickers))
+        latest = close[-1]
+        week_ago = close[-5]
+        month_ago = close[np.where(valid, n_rows - lengths, 0), cols]
+        with np.errstate(divide="ignore", invalid="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # 데이터 없는 열의 nanmax/nanmin
+            high_1m = np.nanmax(high, axis=0)
+            low_1m = np.nanmin(low, axis=0)
+            week_pct = np.where(week_ago != 0, (latest - week_ago) / week_ago * 100, 0.0)
+            month_pct = np.where(month_ago != 0, (latest - month_ago) / month_ago * 100, 0.0)
+            range_pct = np.where(low_1m != 0, (high_1m - low_1m) / low_1m * 100, 0.0)
+        
+        # 계산은 끝났고 여기서는 결과 dict만 구성
+        result = {}
+        for j, t in enumerate(tickers):
+            if not valid[j]:
+                result[t] = dict(empty)
+                continue
+            result[t] = {
+                "value": float(latest[j]),
+                "week_ago": float(week_ago[j]),
+                "month_ago": float(month_ago[j]),
+                "week_change_pct": float(week_pct[j]),
+                "month_change_pct": float(month_pct[j]),
+                "high_1m": float(high_1m[j]),
+                "low_1m": float(low_1m[j]),
+                "range_pct": float(range_pct[j]),
+            }
+        return result
+    
     def calculate_correlations(self, period: str = "3mo") -> Dict:
         """자산간 상관관계 계산"""
         print("    → 상관관계 분석 중...")
+        # 전체 자산을 한 번의 배치 요청으로 다운로드
+        histories = download_history((ticker for _, ticker in _CORRELATION_ASSETS), period=period)
         prices = {}
-        
-        for name, ticker in self.correlation_assets.items():
-            try:
-                data = yf.Ticker(ticker)
-                hist = data.history(period=period)
-                if len(hist) >= 20:
-                    prices[name] = hist['Close'].pct_change().dropna()
-            except:
-                pass
+        for name, ticker in _CORRELATION_ASSETS:
+            hist = histories[ticker]
+            if len(hist) >= 20:
+                prices[name] = hist['Close'].pct_change().dropna()
         
         if len(prices) < 2:
             return {}
         
         # 공통 날짜로 정렬
-        import pandas as pd
         df = pd.DataFrame(prices)
         df = df.dropna()
         
         if len(df) < 20:
             return {}
         
-        # 상관관계 행렬
-        corr_matrix = df.corr()
+        # 상관관계 행렬 (T x N 수익률 → N x N, 단일 BLAS 연산)
+        assets = list(df.columns)
+        corr = np.corrcoef(df.to_numpy(), rowvar=False)
+        corr_matrix = pd.DataFrame(corr, index=assets, columns=assets)
         
-        # 주요 상관관계 추출
-        correlations = {}
-        assets = list(corr_matrix.columns)
-        for i, a1 in enumerate(assets):
-            for a2 in assets[i+1:]:
-                key = f"{a1}_vs_{a2}"
-                correlations[key] = round(corr_matrix.loc[a1, a2], 3)
+        # 주요 상관관계 추출 (상삼각, JIT 커널)
+        rows, cols, pair_values = _extract_pairs(corr)
+        correlations = {
+            f"{assets[i]}_vs_{assets[j]}": v
+            for i, j, v in zip(rows, cols, np.round(pair_values, 3))
+        }
         
         # KOSPI 기준 상관관계
         kospi_corr = {}
-        if "KOSPI" in corr_matrix.columns:
-            for col in corr_matrix.columns:
-                if col != "KOSPI":
-                    kospi_corr[col] = round(corr_matrix.loc["KOSPI", col], 3)
+        if "KOSPI" in assets:
+            idx, row_values = _extract_row(corr, assets.index("KOSPI"))
+            kospi_corr = {assets[j]: v for j, v in zip(idx, np.round(row_values, 3))}
         
         return {
             "matrix": corr_matrix.round(3).to_dict(),
@@ -152,126 +337,68 @@ class MacroAnalyzer:
     
     def get_economic_calendar(self) -> Dict:
         """주간 경제 캘린더 (하드코딩 - 실제로는 API 연동 필요)"""
-        today = datetime.now()
-        week_start = today - timedelta(days=today.weekday())
-        
-        # 샘플 캘린더 (실제로는 경제 캘린더 API 연동)
-        us_events = [
-            {"date": (week_start + timedelta(days=1)).strftime("%m/%d"), "event": "ISM 제조업 PMI", "importance": "HIGH"},
-            {"date": (week_start + timedelta(days=2)).strftime("%m/%d"), "event": "ADP 고용보고서", "importance": "MEDIUM"},
-            {"date": (week_start + timedelta(days=3)).strftime("%m/%d"), "event": "ISM 서비스업 PMI", "importance": "HIGH"},
-            {"date": (week_start + timedelta(days=4)).strftime("%m/%d"), "event": "비농업 고용지표 (NFP)", "importance": "HIGH"},
-            {"date": (week_start + timedelta(days=4)).strftime("%m/%d"), "event": "실업률", "importance": "HIGH"},
-        ]
-        
-        kr_events = [
-            {"date": (week_start + timedelta(days=0)).strftime("%m/%d"), "event": "수출입 동향", "importance": "HIGH"},
-            {"date": (week_start + timedelta(days=2)).strftime("%m/%d"), "event": "소비자물가지수 (CPI)", "importance": "HIGH"},
-            {"date": (week_start + timedelta(days=3)).strftime("%m/%d"), "event": "금융통화위원회", "importance": "HIGH"},
-        ]
-        
-        earnings = [
-            {"date": (week_start + timedelta(days=1)).strftime("%m/%d"), "company": "삼성전자", "market": "KR"},
-            {"date": (week_start + timedelta(days=2)).strftime("%m/%d"), "company": "Apple", "market": "US"},
-            {"date": (week_start + timedelta(days=2)).strftime("%m/%d"), "company": "Amazon", "market": "US"},
-            {"date": (week_start + timedelta(days=3)).strftime("%m/%d"), "company": "SK하이닉스", "market": "KR"},
-        ]
-        
-        return {
-            "week_of": week_start.strftime("%Y-%m-%d"),
-            "us_events": us_events,
-            "kr_events": kr_events,
-            "earnings": earnings,
-        }
+        year, week, _ = datetime.now().isocalendar()
+        # 캐시된 캘린더가 호출자 수정으로 오염되지 않도록 복사본 반환
+        return copy.deepcopy(_weekly_calendar(year, week))
     
     def fetch_korea_rates(self) -> Dict:
         """한국 금리 데이터 (한국은행 기준금리 + 국고채)"""
-        # 한국 금리는 yfinance에서 직접 제공하지 않음
-        # 실제 운영시에는 한국은행 API나 금융투자협회 API 연동 필요
-        # 현재는 최근 데이터 기준 추정치 사용
-        
-        # 2026년 2월 기준 추정 (실제로는 API 연동 필요)
-        # 한국은행 기준금리: 3.00% (2024년 10월 인하 후)
-        # 국고채 3년: 약 2.8~3.0%
-        # 국고채 10년: 약 3.0~3.2%
-        
-        return {
-            "bok_base": {
-                "value": 3.00,
-                "prev": 3.00,
-                "change": 0.0,
-                "change_pct": 0.0,
-                "description": "한국은행 기준금리"
-            },
-            "kr_3y": {
-                "value": 2.85,
-                "prev": 2.90,
-                "change": -0.05,
-                "change_pct": -1.72,
-                "description": "국고채 3년"
-            },
-            "kr_10y": {
-                "value": 3.05,
-                "prev": 3.10,
-                "change": -0.05,
-                "change_pct": -1.61,
-                "description": "국고채 10년"
-            },
-            "kr_spread": {
-                "value": 0.20,  # 10년 - 3년
-                "description": "국고채 10Y-3Y 스프레드"
-            },
-            "kr_us_spread": {
-                "value": -1.22,  # 한국 10년 - 미국 10년 (역전 상태)
-                "description": "한미 금리차 (10Y)"
-            }
-        }
+        return {key: dict(rate) for key, rate in _KOREA_RATES.items()}
     
     def analyze(self) -> Dict:
         print("    → 시장 데이터 수집 중...")
         
+        # 전체 티커를 한 번의 배치 요청으로 다운로드 (티커별 HTTP 왕복 제거)
+        histories = download_history(
+            (ticker for _, ticker in _RATE_TICKERS + _WEEKLY_TICKERS), period="1mo"
+        )
+        
+        data = {}
+        for key, ticker in _RATE_TICKERS:
+            # 금리는 최근 5거래일 기준 (기존 period="5d"와 동일)
+            data[key] = self.fetch_data(ticker, hist=histories[ticker].iloc[-5:])
+        weekly = self.fetch_weekly_batch([ticker for _, ticker in _WEEKLY_TICKERS], histories)
+        for key, ticker in _WEEKLY_TICKERS:
+            data[key] = weekly[ticker]
+        
         # 주요 지수 (주간 데이터)
-        kospi = self.fetch_weekly_data("^KS11")
-        kosdaq = self.fetch_weekly_data("^KQ11")
-        sp500 = self.fetch_weekly_data("^GSPC")
-        nasdaq = self.fetch_weekly_data("^IXIC")
-        dow = self.fetch_weekly_data("^DJI")
-        russell = self.fetch_weekly_data("^RUT")
+        kospi, kosdaq = data["kospi"], data["kosdaq"]
+        sp500, nasdaq, dow, russell = data["sp500"], data["nasdaq"], data["dow"], data["russell"]
         
         # 미국 금리
-        us_10y = self.fetch_data("^TNX")
-        us_2y = self.fetch_data("^IRX")
-        us_30y = self.fetch_data("^TYX")
-        
-        # 한국 금리
-        kr_rates = self.fetch_korea_rates()
-        # 한미 금리차 업데이트 (실시간 미국 금리 반영)
-        kr_rates["kr_us_spread"]["value"] = round(kr_rates["kr_10y"]["value"] - us_10y.get("value", 4.27), 2)
+        us_10y, us_2y, us_30y = data["us_10y"], data["us_2y"], data["us_30y"]
         
         # 변동성
-        vix = self.fetch_weekly_data("^VIX")
+        vix = data["vix"]
         
         # 환율
-        usdkrw = self.fetch_weekly_data("KRW=X")
-        dxy = self.fetch_weekly_data("DX-Y.NYB")
-        eurusd = self.fetch_weekly_data("EURUSD=X")
-        usdjpy = self.fetch_weekly_data("JPY=X")
+        usdkrw, dxy, eurusd, usdjpy = data["usdkrw"], data["dxy"], data["eurusd"], data["usdjpy"]
         
         # 원자재
-        gold = self.fetch_weekly_data("GC=F")
-        silver = self.fetch_weekly_data("SI=F")
-        oil = self.fetch_weekly_data("CL=F")
-        copper = self.fetch_weekly_data("HG=F")
+        gold, silver, oil, copper = data["gold"], data["silver"], data["oil"], data["copper"]
         
         # 크립토
-        btc = self.fetch_weekly_data("BTC-USD")
-        eth = self.fetch_weekly_data("ETH-USD")
+        btc, eth = data["btc"], data["eth"]
+        
+        # 시그널/파생 지표 계산용 값은 한 번만 꺼내 로컬 변수로 사용
+        kospi_wk = kospi.get("week_change_pct", 0.0)
+        sp_wk = sp500.get("week_change_pct", 0.0)
+        krw_wk = usdkrw.get("week_change_pct", 0.0)
+        vix_v = vix.get("value", 0.0)
+        us10_v = us_10y.get("value", 4.27)
+        us10_ch = us_10y.get("change", 0.0)
+        
+        # 한국 금리
+        kr_rates = self.fetch_korea_rates()
+        # 한미 금리차 업데이트 (실시간 미국 금리 반영, 공유 상수는 변경하지 않음)
+        kr_us_spread = dict(kr_rates["kr_us_spread"])
+        kr_us_spread["value"] = round(kr_rates["kr_10y"]["value"] - us10_v, 2)
         
         # MOVE 추정
-        move = {"value": vix.get("value", 0) * 5.5}
+        move = {"value": vix_v * 5.5}
         
         # 스프레드
-        yield_spread = us_10y.get("value", 0) - us_2y.get("value", 0)
+        yield_spread = us10_v - us_2y.get("value", 0)
         
         # 상관관계 분석
         correlations = self.calculate_correlations()
@@ -283,38 +410,41 @@ class MacroAnalyzer:
         signals = []
         
         # KOSPI 추세
-        if kospi.get("week_change_pct", 0) > 2:
-            signals.append(("KOSPI 강세", f"주간 {kospi['week_change_pct']:.1f}% 상승", "POSITIVE"))
-        elif kospi.get("week_change_pct", 0) < -2:
-            signals.append(("KOSPI 약세", f"주간 {kospi['week_change_pct']:.1f}% 하락", "NEGATIVE"))
+        if kospi_wk > 2:
+            signals.append(("KOSPI 강세", f"주간 {kospi_wk:.1f}% 상승", "POSITIVE"))
+        elif kospi_wk < -2:
+            signals.append(("KOSPI 약세", f"주간 {kospi_wk:.1f}% 하락", "NEGATIVE"))
         
         # 미국 시장
-        if sp500.get("week_change_pct", 0) > 2:
-            signals.append(("S&P500 강세", f"주간 {sp500['week_change_pct']:.1f}% 상승", "POSITIVE"))
-        elif sp500.get("week_change_pct", 0) < -2:
-            signals.append(("S&P500 약세", f"주간 {sp500['week_change_pct']:.1f}% 하락", "NEGATIVE"))
+        if sp_wk > 2:
+            signals.append(("S&P500 강세", f"주간 {sp_wk:.1f}% 상승", "POSITIVE"))
+        elif sp_wk < -2:
+            signals.append(("S&P500 약세", f"주간 {sp_wk:.1f}% 하락", "NEGATIVE"))
         
         # 환율
-        if usdkrw.get("week_change_pct", 0) > 1:
+        if krw_wk > 1:
             signals.append(("원화 약세", "수출주 유리, 외국인 이탈 우려", "MIXED"))
-        elif usdkrw.get("week_change_pct", 0) < -1:
+        elif krw_wk < -1:
             signals.append(("원화 강세", "외국인 유입 기대", "POSITIVE"))
         
         # VIX
-        if vix.get("value", 0) > 25:
+        if vix_v > 25:
             signals.append(("VIX 고점", "글로벌 불안, 위험회피", "RISK_OFF"))
-        elif vix.get("value", 0) < 15:
+        elif vix_v < 15:
             signals.append(("VIX 저점", "위험선호 환경", "RISK_ON"))
         
         # 금리
-        if us_10y.get("change", 0) < -0.1:
+        if us10_ch < -0.1:
             signals.append(("미국 금리 하락", "성장주/기술주 우호", "POSITIVE"))
-        elif us_10y.get("change", 0) > 0.1:
+        elif us10_ch > 0.1:
             signals.append(("미국 금리 상승", "가치주/금융주 우호", "NEGATIVE"))
         
         # 종합 판단
-        pos = sum(1 for s in signals if s[2] in ["POSITIVE", "RISK_ON"])
-        neg = sum(1 for s in signals if s[2] in ["NEGATIVE", "RISK_OFF"])
+        pos = neg = 0
+        for s in signals:
+            category = s[2]
+            pos += category in _POSITIVE_SIGNALS
+            neg += category in _NEGATIVE_SIGNALS
         
         if pos > neg:
             overall = "BULLISH"
@@ -337,7 +467,7 @@ class MacroAnalyzer:
                 "kr_3y": kr_rates["kr_3y"],
                 "kr_10y": kr_rates["kr_10y"],
                 "kr_spread": kr_rates["kr_spread"],
-                "kr_us_spread": kr_rates["kr_us_spread"],
+                "kr_us_spread": kr_us_spread,
                 # 미국 금리
                 "us_10y": us_10y, "us_2y": us_2y, "us_30y": us_30y,
                 "yield_spread": yield_spread,
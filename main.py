@@ -3,8 +3,11 @@
 Macro → Industry → Risk → Sentiment 통합 분석
 Claude Sonnet 4 + Finviz + 정하림 MOVE 모형
 """
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, TextIO
 import json
 import os
 
@@ -15,6 +18,80 @@ from sentiment_layer import SentimentAnalyzer
 from report_generator import ReportGenerator
 
 
+_HEAVY_RULE = "=" * 70
+_LIGHT_RULE = "─" * 70
+
+# 레이어별 시그널 → 점수 가감
+_SCORE_DELTAS = {
+    "macro": {"BULLISH": 20, "BEARISH": -20},         # 매크로 (±20)
+    "risk": {"LOW": 15, "HIGH": -15},                 # 리스크 (±15)
+    "sentiment": {"POSITIVE": 15, "NEGATIVE": -15},   # 감성 (±15)
+    "rotation": {"RISK_ON": 10, "RISK_OFF": -10},     # 로테이션 시그널 (±10)
+}
+
+# 점수 구간 경계 (이상) 및 구간별 (판단, 액션, 자산배분)
+_DECISION_THRESHOLDS = (30, 45, 55, 70)
+# 판단 테이블은 읽기 전용 (자산배분은 결과에 넣을 때 dict로 복사)
+_DECISION_TABLE = (
+    ("SELL", "위험자산 대폭 축소", MappingProxyType({"주식": 20, "채권": 50, "현금": 30})),
+    ("REDUCE", "위험자산 비중 축소", MappingProxyType({"주식": 35, "채권": 45, "현금": 20})),
+    ("HOLD", "현재 포지션 유지", MappingProxyType({"주식": 50, "채권": 35, "현금": 15})),
+    ("BUY", "위험자산 비중 확대", MappingProxyType({"주식": 60, "채권": 30, "현금": 10})),
+    ("STRONG_BUY", "위험자산 적극 매수", MappingProxyType({"주식": 70, "채권": 20, "현금": 10})),
+)
+
+# 텍스트 리포트 템플릿 (섹션별 고정 문구는 한 번만 정의)
+_TEXT_REPORT = """{heavy}
+📊 투자 판단 자동화 시스템 - 분석 리포트
+{heavy}
+⏰ 생성 시간: {timestamp}
+💰 포트폴리오: {portfolio_value:,.0f}원
+
+{light}
+📈 [MACRO] 거시경제 환경
+{light}
+  • KOSPI: {kospi:,.2f} ({kospi_chg:+.2f}%)
+  • KOSDAQ: {kosdaq:,.2f} ({kosdaq_chg:+.2f}%)
+  • USD/KRW: {usdkrw:,.0f}원 ({usdkrw_chg:+.2f}%)
+  • US 10Y: {us_10y:.2f}%
+  • VIX: {vix:.1f}
+  • MOVE (추정): {move:.1f}
+  → 판단: {macro_overall} - {macro_recommendation}
+
+{light}
+🏭 [INDUSTRY] 업종 분석
+{light}
+  시장 사이클: {market_cycle}
+  로테이션: {rotation}
+  추천 업종:{sector_lines}
+
+{light}
+⚠️ [RISK] 리스크 분석
+{light}
+  • 리스크 레벨: {risk_level}
+  • 리스크 점수: {risk_score}/100
+  • 변동성 배수: {vol_multiplier:.2f}x
+
+{light}
+📰 [SENTIMENT] 뉴스 감성
+{light}
+  • 감성: {sentiment}
+  • 신뢰도: {confidence:.0f}%
+  • 뉴스 수: {news_count}건
+
+{heavy}
+🎯 [DECISION] 최종 투자 판단
+{heavy}
+  📊 종합 점수: {score}/100
+  🚦 판단: {decision}
+  💡 액션: {action}
+
+  📌 추천 자산배분:{allocation_lines}
+
+  🎯 주력 업종: {primary_sector}
+{heavy}"""
+
+
 class InvestmentAdvisor:
     """
     투자 판단 자동화 시스템
@@ -27,6 +104,8 @@ class InvestmentAdvisor:
     5. DECISION: 최종 투자 판단
     """
     
+    __slots__ = ("macro", "industry", "risk", "sentiment", "report_gen", "portfolio_value")
+    
     def __init__(self, portfolio_value: float = 100000000):
         self.macro = MacroAnalyzer()
         self.industry = IndustryAnalyzer()
@@ -39,32 +118,38 @@ class InvestmentAdvisor:
         """전체 분석 실행"""
         print("\n🔄 분석 시작...")
         
-        # 1. MACRO 분석
-        print("  [1/4] MACRO 분석 중...")
-        macro_result = self.macro.analyze()
-        
-        # 2. INDUSTRY 분석 (매크로 결과 활용)
-        print("  [2/4] INDUSTRY 분석 중...")
-        industry_result = self.industry.analyze(macro_result)
-        
-        # 3. RISK 분석
-        print("  [3/4] RISK 분석 중...")
-        move_value = macro_result["indicators"]["move"]["value"]
-        vix_value = macro_result["indicators"]["vix"].get("value", 18)
-        
-        # QuantLib 분석을 위한 market_data 전달
-        market_data = {
-            "us_10y": macro_result["indicators"]["us_10y"].get("value", 0.0427) / 100,
-            "us_2y": macro_result["indicators"]["us_2y"].get("value", 0.0359) / 100,
-            "us_30y": macro_result["indicators"].get("us_30y", {}).get("value", 0.045) / 100,
-            "vix": vix_value,
-            "kospi": macro_result["indicators"]["kospi"].get("value", 2650),
-        }
-        risk_result = self.risk.analyze(move_value, vix_value, self.portfolio_value, market_data)
-        
-        # 4. SENTIMENT 분석
-        print("  [4/4] SENTIMENT 분석 중...")
-        sentiment_result = self.sentiment.analyze(["금리", "증시", "경제"])
+        # SENTIMENT는 다른 레이어와 독립, INDUSTRY/RISK는 MACRO 결과에만 의존
+        # → 네트워크 대기 구간이 겹치도록 스레드로 동시 실행
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # 4. SENTIMENT 분석 (MACRO와 동시에)
+            print("  [4/4] SENTIMENT 분석 시작 (병렬)...")
+            sentiment_future = executor.submit(self.sentiment.analyze, ["금리", "증시", "경제"])
+            
+            # 1. MACRO 분석
+            print("  [1/4] MACRO 분석 중...")
+            macro_result = self.macro.analyze()
+            
+            # 2. INDUSTRY 분석 (매크로 결과 활용, RISK와 동시에)
+            print("  [2/4] INDUSTRY 분석 시작 (병렬)...")
+            industry_future = executor.submit(self.industry.analyze, macro_result)
+            
+            # 3. RISK 분석
+            print("  [3/4] RISK 분석 중...")
+            move_value = macro_result["indicators"]["move"]["value"]
+            vix_value = macro_result["indicators"]["vix"].get("value", 18)
+            
+            # QuantLib 분석을 위한 market_data 전달
+            market_data = {
+                "us_10y": macro_result["indicators"]["us_10y"].get("value", 0.0427) / 100,
+                "us_2y": macro_result["indicators"]["us_2y"].get("value", 0.0359) / 100,
+                "us_30y": macro_result["indicators"].get("us_30y", {}).get("value", 0.045) / 100,
+                "vix": vix_value,
+                "kospi": macro_result["indicators"]["kospi"].get("value", 2650),
+            }
+            risk_result = self.risk.analyze(move_value, vix_value, self.portfolio_value, market_data)
+            
+            industry_result = industry_future.result()
+            sentiment_result = sentiment_future.result()
         
         print("✅ 분석 완료!")
         
@@ -98,54 +183,19 @@ class InvestmentAdvisor:
         top_sector_catalysts = top_sectors[0].get("catalysts", []) if top_sectors else []
         rotation_signal = claude_analysis.get("rotation_signal", "NEUTRAL")
         
-        # 점수 계산 (100점 만점)
-        score = 50  # 기본
-        
-        # 매크로 반영 (±20)
-        if macro_signal == "BULLISH":
-            score += 20
-        elif macro_signal == "BEARISH":
-            score -= 20
-        
-        # 리스크 반영 (±15)
-        if risk_level == "LOW":
-            score += 15
-        elif risk_level == "HIGH":
-            score -= 15
-        
-        # 감성 반영 (±15)
-        if sentiment == "POSITIVE":
-            score += 15
-        elif sentiment == "NEGATIVE":
-            score -= 15
+        # 점수 계산 (100점 만점) - 기본 50 + 레이어별 가감
+        score = 50 + sum(
+            _SCORE_DELTAS[layer].get(signal, 0)
+            for layer, signal in (
+                ("macro", macro_signal),
+                ("risk", risk_level),
+                ("sentiment", sentiment),
+                ("rotation", rotation_signal),
+            )
+        )
         
-        # 로테이션 시그널 반영 (±10)
-        if rotation_signal == "RISK_ON":
-            score += 10
-        elif rotation_signal == "RISK_OFF":
-            score -= 10
-        
-        # 최종 판단
-        if score >= 70:
-            decision = "STRONG_BUY"
-            action = "위험자산 적극 매수"
-            allocation = {"주식": 70, "채권": 20, "현금": 10}
-        elif score >= 55:
-            decision = "BUY"
-            action = "위험자산 비중 확대"
-            allocation = {"주식": 60, "채권": 30, "현금": 10}
-        elif score >= 45:
-            decision = "HOLD"
-            action = "현재 포지션 유지"
-            allocation = {"주식": 50, "채권": 35, "현금": 15}
-        elif score >= 30:
-            decision = "REDUCE"
-            action = "위험자산 비중 축소"
-            allocation = {"주식": 35, "채권": 45, "현금": 20}
-        else:
-            decision = "SELL"
-            action = "위험자산 대폭 축소"
-            allocation = {"주식": 20, "채권": 50, "현금": 30}
+        # 최종 판단 (점수 구간 → 판단 테이블)
+        decision, action, allocation = _DECISION_TABLE[bisect_right(_DECISION_THRESHOLDS, score)]
         
         # 포지션 사이징 적용
         position_adj = analysis["risk"]["position_sizing"]["adjusted_allocation"]
@@ -155,7 +205,7 @@ class InvestmentAdvisor:
             "score": score,
             "decision": decision,
             "action": action,
-            "allocation": allocation,
+            "allocation": dict(allocation),
             "signals": {
                 "macro": macro_signal,
                 "risk": risk_level,
@@ -170,108 +220,95 @@ class InvestmentAdvisor:
             "risk_warning": risk_score > 70,
         }
     
-    def generate_report(self, analysis: Dict, decision: Dict) -> str:
-        """분석 리포트 생성"""
-        report = []
-        report.append("=" * 70)
-        report.append("📊 투자 판단 자동화 시스템 - 분석 리포트")
-        report.append("=" * 70)
-        report.append(f"⏰ 생성 시간: {decision['timestamp']}")
-        report.append(f"💰 포트폴리오: {self.portfolio_value:,.0f}원")
-        report.append("")
+    def generate_report(self, analysis: Dict, decision: Dict, out: TextIO = None) -> str:
+        """
+        분석 리포트 생성
         
-        # 1. 매크로 요약
-        report.append("─" * 70)
-        report.append("📈 [MACRO] 거시경제 환경")
-        report.append("─" * 70)
+        Args:
+            out: 지정 시 완성된 리포트를 한 번의 write로 바로 기록 (파일, sys.stdout 등)
+        """
         macro = analysis["macro"]
         ind = macro["indicators"]
-        report.append(f"  • KOSPI: {ind['kospi'].get('value', 0):,.2f} ({ind['kospi'].get('week_change_pct', 0):+.2f}%)")
-        report.append(f"  • KOSDAQ: {ind['kosdaq'].get('value', 0):,.2f} ({ind['kosdaq'].get('week_change_pct', 0):+.2f}%)")
-        report.append(f"  • USD/KRW: {ind['usdkrw'].get('value', 0):,.0f}원 ({ind['usdkrw'].get('week_change_pct', 0):+.2f}%)")
-        report.append(f"  • US 10Y: {ind['us_10y'].get('value', 0):.2f}%")
-        report.append(f"  • VIX: {ind['vix'].get('value', 0):.1f}")
-        report.append(f"  • MOVE (추정): {ind['move'].get('value', 0):.1f}")
-        report.append(f"  → 판단: {macro['overall']} - {macro['recommendation']}")
-        report.append("")
-        
-        # 2. 섹터 요약
-        report.append("─" * 70)
-        report.append("🏭 [INDUSTRY] 업종 분석")
-        report.append("─" * 70)
-        industry = analysis["industry"]
-        claude = industry.get("claude_analysis", {})
-        report.append(f"  시장 사이클: {claude.get('market_cycle', 'N/A')}")
-        report.append(f"  로테이션: {claude.get('rotation_signal', 'N/A')}")
-        report.append("  추천 업종:")
-        for s in claude.get("top_sectors", [])[:3]:
-            report.append(f"    🟢 {s.get('name', 'N/A')} ({s.get('score', 0)}점) - {s.get('reasoning', '')[:40]}")
-        report.append("")
-        
-        # 3. 리스크 요약
-        report.append("─" * 70)
-        report.append("⚠️ [RISK] 리스크 분석")
-        report.append("─" * 70)
-        risk = analysis["risk"]
-        rm = risk["risk_metrics"]
-        report.append(f"  • 리스크 레벨: {rm['risk_level']}")
-        report.append(f"  • 리스크 점수: {rm['risk_score']}/100")
-        report.append(f"  • 변동성 배수: {rm['vol_multiplier']:.2f}x")
-        report.append("")
-        
-        # 4. 감성 분석 요약
-        report.append("─" * 70)
-        report.append("📰 [SENTIMENT] 뉴스 감성")
-        report.append("─" * 70)
+        claude = analysis["industry"].get("claude_analysis", {})
+        rm = analysis["risk"]["risk_metrics"]
         sent = analysis["sentiment"]["sentiment"]
-        report.append(f"  • 감성: {sent.get('overall_sentiment', 'N/A')}")
-        report.append(f"  • 신뢰도: {sent.get('confidence', 0)*100:.0f}%")
-        report.append(f"  • 뉴스 수: {analysis['sentiment'].get('news_count', 0)}건")
-        report.append("")
         
-        # 5. 최종 판단
-        report.append("=" * 70)
-        report.append("🎯 [DECISION] 최종 투자 판단")
-        report.append("=" * 70)
-        report.append(f"  📊 종합 점수: {decision['score']}/100")
-        report.append(f"  🚦 판단: {decision['decision']}")
-        report.append(f"  💡 액션: {decision['action']}")
-        report.append("")
-        report.append("  📌 추천 자산배분:")
-        for asset, pct in decision["allocation"].items():
-            bar = "█" * (pct // 5) + "░" * (20 - pct // 5)
-            report.append(f"     {asset}: {bar} {pct}%")
-        report.append("")
-        report.append(f"  🎯 주력 업종: {decision['recommendations']['primary_sector']}")
-        report.append("=" * 70)
+        sector_lines = "".join(
+            f"\n    🟢 {s.get('name', 'N/A')} ({s.get('score', 0)}점) - {s.get('reasoning', '')[:40]}"
+            for s in claude.get("top_sectors", [])[:3]
+        )
+        allocation_lines = "".join(
+            f"\n     {asset}: {'█' * (pct // 5)}{'░' * (20 - pct // 5)} {pct}%"
+            for asset, pct in decision["allocation"].items()
+        )
         
-        return "\n".join(report)
+        report = _TEXT_REPORT.format_map({
+            "heavy": _HEAVY_RULE,
+            "light": _LIGHT_RULE,
+            "timestamp": decision["timestamp"],
+            "portfolio_value": self.portfolio_value,
+            "kospi": ind["kospi"].get("value", 0),
+            "kospi_chg": ind["kospi"].get("week_change_pct", 0),
+            "kosdaq": ind["kosdaq"].get("value", 0),
+            "kosdaq_chg": ind["kosdaq"].get("week_change_pct", 0),
+            "usdkrw": ind["usdkrw"].get("value", 0),
+            "usdkrw_chg": ind["usdkrw"].get("week_change_pct", 0),
+            "us_10y": ind["us_10y"].get("value", 0),
+            "vix": ind["vix"].get("value", 0),
+            "move": ind["move"].get("value", 0),
+            "macro_overall": macro["overall"],
+            "macro_recommendation": macro["recommendation"],
+            "market_cycle": claude.get("market_cycle", "N/A"),
+            "rotation": claude.get("rotation_signal", "N/A"),
+            "sector_lines": sector_lines,
+            "risk_level": rm["risk_level"],
+            "risk_score": rm["risk_score"],
+            "vol_multiplier": rm["vol_multiplier"],
+            "sentiment": sent.get("overall_sentiment", "N/A"),
+            "confidence": sent.get("confidence", 0) * 100,
+            "news_count": analysis["sentiment"].get("news_count", 0),
+            "score": decision["score"],
+            "decision": decision["decision"],
+            "action": decision["action"],
+            "allocation_lines": allocation_lines,
+            "primary_sector": decision["recommendations"]["primary_sector"],
+        })
+        if out is not None:
+            out.write(report)
+        return report
     
-    def run(self) -> str:
-        """전체 시스템 실행"""
+    def run(self, text_path: str = None) -> str:
+        """
+        전체 시스템 실행
+        
+        Args:
+            text_path: 지정 시 텍스트 리포트를 HTML 리포트와 동시에 파일로 저장
+        """
         analysis = self.analyze_all()
         decision = self.make_decision(analysis)
         
-        # 텍스트 리포트
-        text_report = self.generate_report(analysis, decision)
+        # HTML 리포트 생성 (섹션 조각 그대로 파일에 기록 - 전체 문자열 결합 생략)
+        html_parts = self.report_gen.generate_html_parts(analysis, decision, self.portfolio_value)
         
-        # HTML 리포트 생성
-        html_report = self.report_gen.generate_html_report(analysis, decision, self.portfolio_value)
-        html_path = self.report_gen.save_report(html_report)
+        # HTML 파일 쓰기와 텍스트 리포트 생성/기록을 동시에 진행 (블로킹 I/O 대기 중첩)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            html_future = executor.submit(self.report_gen.save_report, html_parts)
+            if text_path:
+                with open(text_path, "w", encoding="utf-8") as f:
+                    text_report = self.generate_report(analysis, decision, out=f)
+            else:
+                text_report = self.generate_report(analysis, decision)
+            html_path = html_future.result()
         
         return text_report, html_path
 
 
 if __name__ == "__main__":
-    # 시스템 실행
+    # 시스템 실행 (텍스트 리포트는 HTML과 함께 저장)
     advisor = InvestmentAdvisor(portfolio_value=100000000)  # 1억원
-    text_report, html_path = advisor.run()
+    text_report, html_path = advisor.run(text_path="investment_report.txt")
     
     print(text_report)
     print(f"\n📄 HTML 리포트: {html_path}")
     print("브라우저에서 열어보세요!")
-    
-    # 텍스트 리포트 저장
-    with open("investment_report.txt", "w", encoding="utf-8") as f:
-        f.write(text_report)
     print("📄 텍스트 리포트: investment_report.txt")
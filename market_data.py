@@ -0,0 +1,88 @@
+"""
+시장 데이터 수집 - yfinance 배치 다운로드 공통 모듈
+"""
+import hashlib
+import os
+import time
+from typing import Dict, Iterable
+import pandas as pd
+import yfinance as yf
+
+# 디스크 캐시 (15분 TTL - 의미 있는 매크로 시그널 주기보다 짧게)
+CACHE_DIR = ".yf_cache"
+CACHE_TTL = 900
+
+# 수집 중 예상되는 실패 유형 (requests/curl_cffi 네트워크 오류는 모두 OSError 하위 클래스)
+FETCH_ERRORS = (OSError, KeyError, IndexError, ValueError)
+
+
+def _cache_path(tickers: list, period: str) -> str:
+    key = f"{period}|{','.join(sorted(tickers))}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"{digest}.pkl")
+
+
+def _load_cached(path: str):
+    try:
+        if time.time() - os.path.getmtime(path) < CACHE_TTL:
+            return pd.read_pickle(path)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _store_cached(path: str, data: pd.DataFrame) -> None:
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        data.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def download_history(tickers: Iterable[str], period: str = "1mo",
+                     use_cache: bool = True) -> Dict[str, pd.DataFrame]:
+    """
+    여러 티커의 히스토리를 배치 요청으로 한 번에 다운로드
+
+    Args:
+        tickers: 티커 목록 (중복은 한 번만 요청)
+        period: 조회 기간 (예: "1mo", "3mo")
+        use_cache: TTL 내 동일 요청은 디스크 캐시에서 반환
+
+    Returns:
+        {티커: OHLCV DataFrame} - 데이터가 없는 티커는 빈 DataFrame
+    """
+    tickers = list(dict.fromkeys(tickers))
+    path = _cache_path(tickers, period)
+    data = _load_cached(path) if use_cache else None
+
+    if data is None:
+        try:
+            data = yf.download(
+                tickers=" ".join(tickers),
+                period=period,
+                group_by="ticker",
+                threads=True,
+                progress=False,
+            )
+        except FETCH_ERRORS:
+            data = pd.DataFrame()
+        # 실패한 응답은 캐시하지 않음
+        if use_cache and not data.empty:
+            _store_cached(path, data)
+
+    # 구버전 yfinance는 단일 티커 요청에 (티커, 필드) 2단 대신 필드 컬럼만 반환
+    if len(tickers) == 1 and len(data.columns) and not isinstance(data.columns, pd.MultiIndex):
+        data = pd.concat({tickers[0]: data}, axis=1)
+    
+    available = set(data.columns.get_level_values(0)) if len(data.columns) else set()
+    histories = {}
+    for ticker in tickers:
+        if ticker in available:
+            # 티커별 거래일이 달라 생기는 빈 행 제거
+            histories[ticker] = data[ticker].dropna(how="all")
+        else:
+            histories[ticker] = pd.DataFrame()
+    return histories
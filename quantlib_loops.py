@@ -0,0 +1,102 @@
+"""
+QuantLib 분석용 수치 커널 - numba가 있으면 JIT 컴파일, 없으면 순수 Python
+
+명시적 시그니처로 import 시점에 컴파일 (첫 호출 지연 제거),
+cache=True로 컴파일 결과를 __pycache__에 저장해 이후 실행은 캐시 로딩
+"""
+import numpy as np
+from jit_utils import njit, prange
+
+
+@njit("UniTuple(f8, 4)(f8, f8, f8, i8, i8)", cache=True)
+def _bond_metrics(face, coupon, ytm_period, n, frequency):
+    """
+    채권 가격/Macaulay 듀레이션/수정 듀레이션/볼록성 (단일 루프)
+
+    할인계수를 매 기간 거듭제곱하지 않고 누적 곱으로 갱신
+    """
+    inv = 1.0 / (1.0 + ytm_period)
+    df = 1.0
+    pv_coupons = 0.0
+    weighted_cf = 0.0
+    convexity_sum = 0.0
+    for t in range(1, n + 1):
+        df *= inv
+        pv = coupon * df
+        pv_coupons += pv
+        weighted_cf += t * pv
+        convexity_sum += t * (t + 1) * pv
+
+    # 만기 원금 (df = 1 / (1+y)^n)
+    pv_face = face * df
+    price = pv_coupons + pv_face
+    weighted_cf += n * pv_face
+    convexity_sum = (convexity_sum + n * (n + 1) * pv_face) * inv * inv
+
+    mac_duration = weighted_cf / price / frequency
+    mod_duration = mac_duration * inv
+    convexity = convexity_sum / (price * frequency * frequency)
+    return price, mac_duration, mod_duration, convexity
+
+
+@njit("void(f8, f8[::1], f8, f8, f8, f8[::1], f8[::1])", cache=True, fastmath=True)
+def _vasicek_zcb(r0, t_arr, a, b, sigma, out_price, out_yield):
+    """Vasicek 제로쿠폰 채권 가격/수익률 (closed-form, 만기 배열 단일 루프)"""
+    drift = b - sigma * sigma / (2.0 * a * a)
+    var_coef = sigma * sigma / (4.0 * a)
+    for i in range(t_arr.shape[0]):
+        t = t_arr[i]
+        B = (1.0 - np.exp(-a * t)) / a
+        # P = A * exp(-B*r0) = exp(ln A - B*r0) → 지수 한 번, 수익률은 지수에서 바로
+        log_price = drift * (B - t) - var_coef * B * B - B * r0
+        out_price[i] = np.exp(log_price)
+        out_yield[i] = -log_price / t
+
+
+@njit("Tuple((f8, f8, f8, f8[::1]))(f8[::1], f8[::1])", cache=True)
+def _curve_kernel(t, y):
+    """
+    정렬된 (기간, 금리) 배열 → (기울기, 단기금리, 장기금리, 포워드 레이트 배열)
+
+    f(t1, t2) = (r2*t2 - r1*t1) / (t2 - t1)
+    """
+    n = t.shape[0]
+    fwd = np.empty(n - 1)
+    for i in range(n - 1):
+        fwd[i] = (y[i + 1] * t[i + 1] - y[i] * t[i]) / (t[i + 1] - t[i])
+    return y[n - 1] - y[0], y[0], y[n - 1], fwd
+
+
+@njit("Tuple((f8[::1], f8[::1], f8[::1], f8[:, ::1]))(f8[:, ::1], f8[:, ::1])", cache=True, parallel=True)
+def _curve_kernel_batch(t2, y2):
+    """시나리오별 (기간, 금리) 행 → 기울기/단기/장기 금리 및 포워드 레이트 (시나리오 축 병렬)"""
+    n_scen, n = t2.shape
+    slopes = np.empty(n_scen)
+    shorts = np.empty(n_scen)
+    longs = np.empty(n_scen)
+    fwds = np.empty((n_scen, n - 1))
+    for k in prange(n_scen):
+        order = np.argsort(t2[k], kind="mergesort")
+        t = t2[k][order]
+        y = y2[k][order]
+        slopes[k], shorts[k], longs[k], fwds[k] = _curve_kernel(t, y)
+    return slopes, shorts, longs, fwds
+
+
+@njit("Tuple((f8, f8, f8, i8))(f8, f8, f8, f8)", cache=True)
+def _option_summary(spot, strike, price, sign):
+    """
+    옵션 내재가치/손익분기점/시간가치/내가격 여부 (sign: 콜 +1, 풋 -1)
+
+    moneyness 코드: 0=ITM, 1=OTM, 2=ATM
+    """
+    diff = sign * (spot - strike)
+    intrinsic = max(0.0, diff)
+    breakeven = strike + sign * price
+    if diff > 0:
+        moneyness = 0
+    elif diff < 0:
+        moneyness = 1
+    else:
+        moneyness = 2
+    return intrinsic, breakeven, price - intrinsic, moneyness
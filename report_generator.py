@@ -1,60 +1,144 @@
 """
 Weekly Investment Strategy Report - WSJ Style + QuantLib + Macro Focus
 """
+from bisect import bisect_right
 from datetime import datetime, timedelta
-from typing import Dict, List
+from functools import lru_cache
+from html import escape
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
+import hashlib
+import json
 import os
+import time
 
 
-class ReportGenerator:
-    def __init__(self):
-        self.report_dir = "reports"
-        os.makedirs(self.report_dir, exist_ok=True)
-    
-    def save_report(self, html: str, filename: str = None) -> str:
-        if not filename:
-            filename = f"weekly_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-        path = os.path.join(self.report_dir, filename)
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(html)
-        return path
+# 부호(+1/-1/0)별 등락 수치 포맷
+_FMT_SPAN = (
+    '{:.2f}{}',
+    '<span class="positive">{:+.2f}{}</span>',
+    '<span class="negative">{:.2f}{}</span>',
+)
 
-    def generate_html_report(self, analysis: Dict, decision: Dict, portfolio_value: float) -> str:
-        ts = datetime.now()
-        week_start = ts - timedelta(days=ts.weekday())
-        week_end = week_start + timedelta(days=4)
-        
-        macro = analysis.get("macro", {})
-        industry = analysis.get("industry", {})
-        risk = analysis.get("risk", {})
-        sentiment = analysis.get("sentiment", {})
-        
-        ind = macro.get("indicators", {})
-        corr = macro.get("correlations", {})
-        calendar = macro.get("calendar", {})
-        claude = industry.get("claude_analysis", {})
-        risk_m = risk.get("risk_metrics", {})
-        quantlib = risk.get("quantlib", {})
-        kr_sectors = industry.get("kr_sectors", [])
-        alloc = decision.get("allocation", {})
-        
-        html = self._get_styles()
-        html += self._build_header(ts, week_start, week_end, decision)
-        html += self._build_executive_summary(macro, claude, decision)
-        html += self._build_macro_dashboard(ind, quantlib)
-        html += self._build_macro_analysis(ind, macro)
-        html += self._build_cycle_chart(claude, ind)
-        html += self._build_calendar_section(calendar)
-        html += self._build_sector_section(kr_sectors, claude)
-        html += self._build_quantlib_section(quantlib)
-        html += self._build_risk_section(risk_m, quantlib)
-        html += self._build_recommendation_section(alloc, decision)
-        html += self._build_footer(ts)
-        
-        return html
 
-    def _get_styles(self) -> str:
-        return '''<!DOCTYPE html>
+def _fmt(v, suffix=""):
+    """등락 수치 → 부호별 색상 span"""
+    # numpy 스칼라 비교 결과(np.bool_)는 뺄셈이 안 되므로 bool로 변환 (-1 → 마지막 항목)
+    return _FMT_SPAN[bool(v > 0) - bool(v < 0)].format(v, suffix)
+
+
+# 지표별 시그널 규칙: (변화율 기준 여부, 상단, 하단, 상단 초과 시, 하단 미만 시, 중립)
+_SIGNAL_RULES = MappingProxyType({
+    "us_10y": (False, 4.5, 4.0, ("BEARISH", "금리 상승 → 성장주 부담"), ("BULLISH", "금리 안정 → 성장주 우호"), ("NEUTRAL", "금리 중립")),
+    "dxy": (False, 105, 100, ("BEARISH", "달러 강세 → EM 자금 이탈"), ("BULLISH", "달러 약세 → EM 자금 유입"), ("NEUTRAL", "달러 중립")),
+    "vix": (False, 25, 15, ("BEARISH", "변동성 확대 → Risk-Off"), ("BULLISH", "변동성 축소 → Risk-On"), ("NEUTRAL", "변동성 보통")),
+    "usdkrw": (False, 1400, 1300, ("MIXED", "원화 약세 → 수출 유리, 외인 이탈"), ("BULLISH", "원화 강세 → 외인 유입"), ("NEUTRAL", "환율 안정")),
+    "gold": (True, 3, -3, ("BEARISH", "안전자산 선호 → Risk-Off"), ("BULLISH", "위험자산 선호"), ("NEUTRAL", "중립")),
+    "oil": (True, 5, -5, ("BULLISH", "유가 상승 → 인플레 우려"), ("BEARISH", "유가 하락 → 경기 둔화 우려"), ("NEUTRAL", "유가 안정")),
+    "kr_us_spread": (False, 0, -1.0, ("BULLISH", "한미 금리 정상화 → 외인 유입"), ("BEARISH", "한미 금리 역전 → 외인 이탈 압력"), ("NEUTRAL", "한미 금리차 중립")),
+})
+_NO_SIGNAL = ("NEUTRAL", "")
+
+
+def _get_signal(name, value, change=0):
+    """지표 수준/변화율 → (시그널, 해석)"""
+    rule = _SIGNAL_RULES.get(name)
+    if rule is None:
+        return _NO_SIGNAL
+    use_change, high, low, above, below, neutral = rule
+    x = change if use_change else value
+    if x > high:
+        return above
+    if x < low:
+        return below
+    return neutral
+
+
+# 시그널 → 지표 카드 CSS 클래스 (그 외는 "")
+_SIG_CLS = MappingProxyType({"BULLISH": "bullish", "BEARISH": "bearish"})
+
+# 시그널 → 시그널 박스 HTML (_SIGNAL_RULES에 나오는 시그널 전부)
+_SIG_BOX = MappingProxyType({
+    sig: f'<span class="signal-box signal-{cls}">{sig}</span>'
+    for sig, cls in (("BULLISH", "bullish"), ("BEARISH", "bearish"),
+                     ("NEUTRAL", "neutral"), ("MIXED", "neutral"))
+})
+
+
+# 누락 지표 조회 시 공유하는 빈 매핑 (호출마다 {} 생성 방지)
+_EMPTY = MappingProxyType({})
+
+
+def _g(d, key):
+    """d[key] 지표 dict 조회 - 없으면 공유 빈 매핑"""
+    return d.get(key) or _EMPTY
+
+
+# 데이터 수집 실패 시 섹션 대체 (0으로 채운 표를 만들지 않음)
+_NO_DATA_SECTION = '''
+<div class="section">
+    <div class="section-title">{title}</div>
+    <p class="body-text" style="color: #888;">데이터 없음 (수집 실패)</p>
+</div>
+'''
+_NO_MACRO_DASHBOARD = _NO_DATA_SECTION.format(title="Macro Dashboard")
+_NO_MACRO_ANALYSIS = _NO_DATA_SECTION.format(title="Macro Indicators Analysis")
+_NO_CALENDAR = _NO_DATA_SECTION.format(title="Economic Calendar")
+_NO_SECTORS = _NO_DATA_SECTION.format(title="Sector Analysis")
+
+def _h(text) -> str:
+    """외부 텍스트(Claude/뉴스 응답, 일정/종목명)를 본문에 넣기 전 HTML 이스케이프"""
+    return escape(str(text), quote=False)
+
+
+# 경제 캘린더 행 템플릿
+_CAL_EVENT_ROW = '<div class="calendar-item"><span class="calendar-date">{date}</span> <span class="calendar-event {imp_cls}">{event}</span></div>'
+_CAL_EARNINGS_ROW = '<div class="calendar-item"><span class="calendar-date">{date}</span> {company} ({market})</div>'
+_CAL_NO_EVENTS = '<p style="color: #888;">No events</p>'
+_CAL_NO_EARNINGS = '<p style="color: #888;">No earnings</p>'
+
+
+def _calendar_event_row(e):
+    return _CAL_EVENT_ROW.format(
+        date=e.get("date", ""),
+        imp_cls="importance-high" if e.get("importance") == "HIGH" else "",
+        event=_h(e.get("event", "")),
+    )
+
+
+# 날짜 포맷
+_FMT_WEEK_START = "%B %d"
+_FMT_WEEK_END = "%d, %Y"
+_FMT_GENERATED = "%Y-%m-%d %H:%M:%S KST"
+_FMT_FILENAME = "weekly_report_%Y%m%d_%H%M%S.html"
+
+# 사이클 위치 (시계 방향: 12시=EARLY_EXPANSION)
+_CYCLE_POSITIONS = MappingProxyType({
+    "EARLY_EXPANSION": {"angle": 0, "x": 120, "y": 20},
+    "MID_EXPANSION": {"angle": 45, "x": 200, "y": 60},
+    "LATE_EXPANSION": {"angle": 90, "x": 220, "y": 120},
+    "PEAK": {"angle": 135, "x": 200, "y": 180},
+    "EARLY_CONTRACTION": {"angle": 180, "x": 120, "y": 220},
+    "MID_CONTRACTION": {"angle": 225, "x": 40, "y": 180},
+    "LATE_CONTRACTION": {"angle": 270, "x": 20, "y": 120},
+    "TROUGH": {"angle": 315, "x": 40, "y": 60},
+    "RECESSION": {"angle": 180, "x": 120, "y": 220},
+})
+
+# 각 사이클 단계별 추천 섹터
+_CYCLE_SECTORS = MappingProxyType({
+    "EARLY_EXPANSION": "기술주, 소비재, 금융",
+    "MID_EXPANSION": "산업재, 소재, 에너지",
+    "LATE_EXPANSION": "에너지, 소재, 필수소비재",
+    "PEAK": "필수소비재, 헬스케어, 유틸리티",
+    "EARLY_CONTRACTION": "유틸리티, 헬스케어, 채권",
+    "RECESSION": "채권, 현금, 방어주",
+})
+
+
+# 리포트 공통 헤더/CSS (정적 문자열 - 리포트마다 재생성하지 않음)
+_STYLES_HTML = '''<!DOCTYPE html>
 <html lang="ko">
 <head>
 <meta charset="UTF-8">
@@ -132,184 +216,94 @@ body { font-family: 'Noto Serif KR', Georgia, serif; background: #f5f5f5; color:
 <div class="container">
 '''
 
-    def _build_header(self, ts, week_start, week_end, decision) -> str:
-        decision_text = {
-            "STRONG_BUY": "Risk-On: 위험자산 적극 매수 권고",
-            "BUY": "Overweight: 위험자산 비중 확대 권고",
-            "HOLD": "Neutral: 현 포지션 유지 권고",
-            "REDUCE": "Underweight: 위험자산 비중 축소 권고",
-            "SELL": "Risk-Off: 방어적 포지션 전환 권고"
-        }
-        headline = decision_text.get(decision.get('decision', ''), 'Weekly Market Review')
-        
-        return f'''
-<div class="masthead">
-    <div class="masthead-title">Weekly Investment Report</div>
-    <div class="masthead-date">Week of {week_start.strftime("%B %d")} - {week_end.strftime("%d, %Y")} | Seoul</div>
-</div>
-<div class="headline">{headline}</div>
-<div class="subheadline">Score {decision.get('score', 0)}/100 · {decision.get('decision', 'N/A')}</div>
-<div class="byline">AI Investment Research · Macro + QuantLib Analysis</div>
-'''
 
-    def _build_executive_summary(self, macro, claude, decision) -> str:
-        rec = macro.get("recommendation", "")
-        cycle = claude.get("market_cycle", "N/A").replace("_", " ")
-        cycle_reason = claude.get("cycle_reasoning", "")
-        trading_idea = claude.get("trading_idea", "")
-        policy = claude.get("policy_impact", "")
-        
-        return f'''
-<div class="section">
-    <div class="section-title">Executive Summary</div>
-    <p class="lead">{rec}</p>
-    <p class="body-text"><strong>Market Cycle:</strong> {cycle}. {cycle_reason}</p>
-    <p class="body-text">{trading_idea}</p>
-    <p class="body-text">{policy}</p>
-</div>
-'''
+# 로테이션 시그널 → 시그널 박스 CSS 클래스 (그 외는 signal-neutral)
+_ROTATION_CLS = MappingProxyType({"RISK_ON": "signal-bullish", "RISK_OFF": "signal-bearish"})
 
-    def _build_macro_dashboard(self, ind, quantlib) -> str:
-        """매크로 대시보드 - 핵심 지표 한눈에"""
-        def fmt(v, suffix=""):
-            if v > 0: return f'<span class="positive">+{v:.2f}{suffix}</span>'
-            elif v < 0: return f'<span class="negative">{v:.2f}{suffix}</span>'
-            return f'{v:.2f}{suffix}'
-        
-        kospi = ind.get("kospi", {})
-        sp500 = ind.get("sp500", {})
-        usdkrw = ind.get("usdkrw", {})
-        dxy = ind.get("dxy", {})
-        vix = ind.get("vix", {})
-        us10y = ind.get("us_10y", {})
-        gold = ind.get("gold", {})
-        oil = ind.get("oil", {})
-        
-        # 한국 금리
-        bok_base = ind.get("bok_base", {})
-        kr_10y = ind.get("kr_10y", {})
-        kr_us_spread = ind.get("kr_us_spread", {})
-        
-        # Yield curve from quantlib
-        yc = quantlib.get("yield_curve", {}) if quantlib else {}
-        yc_shape = yc.get("curve_shape", "N/A")
-        yc_slope = yc.get("slope_bps", 0)
-        
-        return f'''
+# 사이클 국면별 특징
+_CYCLE_TRAITS_EXPANSION = "• GDP 성장 가속<br>• 기업이익 개선<br>• 금리 상승 초기<br>• 주식 > 채권"
+_CYCLE_TRAITS_CONTRACTION = "• GDP 성장 둔화<br>• 기업이익 정체<br>• 금리 고점<br>• 방어주 선호"
+_CYCLE_TRAITS_RECOVERY = "• 경기 바닥 확인<br>• 정책 완화 기대<br>• 선행지표 개선<br>• 성장주 매수 기회"
+
+# 산업 사이클 차트 섹션 템플릿 (현재 위치/국면/추천 섹터만 채움)
+_CYCLE_CHART_TMPL = '''
 <div class="section">
-    <div class="section-title">Macro Dashboard</div>
-    <div class="five-column">
-        <div class="stat-box">
-            <div class="stat-value">{kospi.get("value", 0):,.0f}</div>
-            <div class="stat-label">KOSPI</div>
-            <div class="stat-change">{fmt(kospi.get("week_change_pct", 0), "%")}</div>
-        </div>
-        <div class="stat-box">
-            <div class="stat-value">{sp500.get("value", 0):,.0f}</div>
-            <div class="stat-label">S&P 500</div>
-            <div class="stat-change">{fmt(sp500.get("week_change_pct", 0), "%")}</div>
-        </div>
-        <div class="stat-box">
-            <div class="stat-value">{bok_base.get("value", 0):.2f}%</div>
-            <div class="stat-label">한은 기준금리</div>
-            <div class="stat-change">{fmt(bok_base.get("change", 0), "%p")}</div>
-        </div>
-        <div class="stat-box">
-            <div class="stat-value">{kr_10y.get("value", 0):.2f}%</div>
-            <div class="stat-label">국고채 10Y</div>
-            <div class="stat-change">{fmt(kr_10y.get("change", 0), "%p")}</div>
-        </div>
-        <div class="stat-box">
-            <div class="stat-value">{kr_us_spread.get("value", 0):.2f}%p</div>
-            <div class="stat-label">한미 금리차</div>
-            <div class="stat-change">{'<span class="negative">역전</span>' if kr_us_spread.get("value", 0) < 0 else '<span class="positive">정상</span>'}</div>
-        </div>
-    </div>
-    <div class="five-column" style="margin-top: 12px;">
-        <div class="stat-box">
-            <div class="stat-value">{us10y.get("value", 0):.2f}%</div>
-            <div class="stat-label">US 10Y</div>
-            <div class="stat-change">{fmt(us10y.get("change_pct", 0), "%")}</div>
-        </div>
-        <div class="stat-box">
-            <div class="stat-value">{usdkrw.get("value", 0):,.0f}</div>
-            <div class="stat-label">USD/KRW</div>
-            <div class="stat-change">{fmt(usdkrw.get("week_change_pct", 0), "%")}</div>
-        </div>
-        <div class="stat-box">
-            <div class="stat-value">{dxy.get("value", 0):.1f}</div>
-            <div class="stat-label">DXY</div>
-            <div class="stat-change">{fmt(dxy.get("week_change_pct", 0), "%")}</div>
-        </div>
-        <div class="stat-box">
-            <div class="stat-value">{vix.get("value", 0):.1f}</div>
-            <div class="stat-label">VIX</div>
-            <div class="stat-change">{fmt(vix.get("week_change_pct", 0), "%")}</div>
+    <div class="section-title">Business Cycle Analysis</div>
+    
+    <div class="two-column">
+        <div>
+            <div style="position: relative; width: 260px; height: 260px; margin: 0 auto;">
+                <!-- 사이클 원 -->
+                <svg width="260" height="260" style="position: absolute; top: 0; left: 0;">
+                    <circle cx="130" cy="130" r="100" fill="none" stroke="#ddd" stroke-width="2"/>
+                    <circle cx="130" cy="130" r="60" fill="none" stroke="#eee" stroke-width="1"/>
+                    
+                    <!-- 사분면 라인 -->
+                    <line x1="130" y1="30" x2="130" y2="230" stroke="#eee" stroke-width="1"/>
+                    <line x1="30" y1="130" x2="230" y2="130" stroke="#eee" stroke-width="1"/>
+                    
+                    <!-- 화살표 (시계방향) -->
+                    <path d="M 130 35 L 135 45 L 125 45 Z" fill="#999"/>
+                    <path d="M 225 130 L 215 135 L 215 125 Z" fill="#999"/>
+                    <path d="M 130 225 L 125 215 L 135 215 Z" fill="#999"/>
+                    <path d="M 35 130 L 45 125 L 45 135 Z" fill="#999"/>
+                    
+                    <!-- 현재 위치 표시 -->
+                    <circle cx="{x}" cy="{y}" r="8" fill="#222"/>
+                    <circle cx="{x}" cy="{y}" r="12" fill="none" stroke="#222" stroke-width="2"/>
+                </svg>
+                
+                <!-- 라벨 -->
+                <div style="position: absolute; top: 5px; left: 50%; transform: translateX(-50%); font-size: 10px; font-weight: 600; text-align: center;">
+                    EARLY<br>EXPANSION
+                </div>
+                <div style="position: absolute; top: 50%; right: 0; transform: translateY(-50%); font-size: 10px; font-weight: 600; text-align: center;">
+                    LATE<br>EXPANSION
+                </div>
+                <div style="position: absolute; bottom: 5px; left: 50%; transform: translateX(-50%); font-size: 10px; font-weight: 600; text-align: center;">
+                    CONTRACTION
+                </div>
+                <div style="position: absolute; top: 50%; left: 0; transform: translateY(-50%); font-size: 10px; font-weight: 600; text-align: center;">
+                    RECOVERY
+                </div>
+                
+                <!-- 중앙 텍스트 -->
+                <div style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); text-align: center;">
+                    <div style="font-size: 11px; font-weight: 700; color: #222;">CURRENT</div>
+                    <div style="font-size: 14px; font-weight: 700; color: #222; margin-top: 3px;">{cycle_display}</div>
+                </div>
+            </div>
         </div>
-        <div class="stat-box">
-            <div class="stat-value">${gold.get("value", 0):,.0f}</div>
-            <div class="stat-label">Gold</div>
-            <div class="stat-change">{fmt(gold.get("week_change_pct", 0), "%")}</div>
+        
+        <div>
+            <div class="macro-card">
+                <div class="macro-title">Current Cycle Position</div>
+                <div class="macro-value" style="font-size: 18px;">{cycle_display}</div>
+                <div class="macro-detail" style="margin-top: 10px;">
+                    <strong>Rotation Signal:</strong> 
+                    <span class="signal-box {rotation_cls}">{rotation}</span>
+                </div>
+            </div>
+            
+            <div class="macro-card">
+                <div class="macro-title">Recommended Sectors</div>
+                <div class="macro-detail">{rec_sectors}</div>
+            </div>
+            
+            <div class="macro-card">
+                <div class="macro-title">Cycle Characteristics</div>
+                <div class="macro-detail" style="font-size: 12px; line-height: 1.6;">
+                    {cycle_traits}
+                </div>
+            </div>
         </div>
     </div>
 </div>
 '''
 
-    def _build_macro_analysis(self, ind, macro) -> str:
-        """상세 매크로 분석"""
-        def fmt(v, suffix=""):
-            if v > 0: return f'<span class="positive">+{v:.2f}{suffix}</span>'
-            elif v < 0: return f'<span class="negative">{v:.2f}{suffix}</span>'
-            return f'{v:.2f}{suffix}'
-        
-        def get_signal(name, value, change=0):
-            signals = {
-                "us_10y": ("BEARISH", "금리 상승 → 성장주 부담") if value > 4.5 else ("BULLISH", "금리 안정 → 성장주 우호") if value < 4.0 else ("NEUTRAL", "금리 중립"),
-                "dxy": ("BEARISH", "달러 강세 → EM 자금 이탈") if value > 105 else ("BULLISH", "달러 약세 → EM 자금 유입") if value < 100 else ("NEUTRAL", "달러 중립"),
-                "vix": ("BEARISH", "변동성 확대 → Risk-Off") if value > 25 else ("BULLISH", "변동성 축소 → Risk-On") if value < 15 else ("NEUTRAL", "변동성 보통"),
-                "usdkrw": ("MIXED", "원화 약세 → 수출 유리, 외인 이탈") if value > 1400 else ("BULLISH", "원화 강세 → 외인 유입") if value < 1300 else ("NEUTRAL", "환율 안정"),
-                "gold": ("BEARISH", "안전자산 선호 → Risk-Off") if change > 3 else ("BULLISH", "위험자산 선호") if change < -3 else ("NEUTRAL", "중립"),
-                "oil": ("BULLISH", "유가 상승 → 인플레 우려") if change > 5 else ("BEARISH", "유가 하락 → 경기 둔화 우려") if change < -5 else ("NEUTRAL", "유가 안정"),
-                "kr_us_spread": ("BEARISH", "한미 금리 역전 → 외인 이탈 압력") if value < -1.0 else ("BULLISH", "한미 금리 정상화 → 외인 유입") if value > 0 else ("NEUTRAL", "한미 금리차 중립"),
-            }
-            return signals.get(name, ("NEUTRAL", ""))
-        
-        # 한국 금리
-        bok_base = ind.get("bok_base", {})
-        kr_3y = ind.get("kr_3y", {})
-        kr_10y = ind.get("kr_10y", {})
-        kr_spread = ind.get("kr_spread", {})
-        kr_us_spread = ind.get("kr_us_spread", {})
-        
-        # 미국 금리
-        us10y = ind.get("us_10y", {})
-        us2y = ind.get("us_2y", {})
-        us30y = ind.get("us_30y", {})
-        dxy = ind.get("dxy", {})
-        vix = ind.get("vix", {})
-        usdkrw = ind.get("usdkrw", {})
-        gold = ind.get("gold", {})
-        oil = ind.get("oil", {})
-        copper = ind.get("copper", {})
-        btc = ind.get("btc", {})
-        
-        # 시그널 계산
-        sig_10y = get_signal("us_10y", us10y.get("value", 0))
-        sig_dxy = get_signal("dxy", dxy.get("value", 0))
-        sig_vix = get_signal("vix", vix.get("value", 0))
-        sig_krw = get_signal("usdkrw", usdkrw.get("value", 0))
-        sig_gold = get_signal("gold", 0, gold.get("week_change_pct", 0))
-        sig_oil = get_signal("oil", 0, oil.get("week_change_pct", 0))
-        sig_kr_us = get_signal("kr_us_spread", kr_us_spread.get("value", 0))
-        
-        def signal_class(sig):
-            return "bullish" if sig == "BULLISH" else "bearish" if sig == "BEARISH" else ""
-        
-        def signal_box(sig):
-            cls = "signal-bullish" if sig == "BULLISH" else "signal-bearish" if sig == "BEARISH" else "signal-neutral"
-            return f'<span class="signal-box {cls}">{sig}</span>'
-        
-        return f'''
+
+# 상세 매크로 분석 섹션 템플릿 (format_map으로 값 채움)
+_MACRO_ANALYSIS_TMPL = '''
 <div class="section">
     <div class="section-title">Macro Indicators Analysis</div>
     
@@ -318,27 +312,27 @@ body { font-family: 'Noto Serif KR', Georgia, serif; background: #f5f5f5; color:
             <div class="macro-card">
                 <div class="macro-title">Interest Rates (Korea)</div>
                 <table class="mini-table" style="width: 100%;">
-                    <tr><td>한은 기준금리</td><td class="number">{bok_base.get("value", 0):.2f}%</td><td>{fmt(bok_base.get("change", 0), "%p")}</td></tr>
-                    <tr><td>국고채 3년</td><td class="number">{kr_3y.get("value", 0):.2f}%</td><td>{fmt(kr_3y.get("change", 0), "%p")}</td></tr>
-                    <tr><td>국고채 10년</td><td class="number">{kr_10y.get("value", 0):.2f}%</td><td>{fmt(kr_10y.get("change", 0), "%p")}</td></tr>
-                    <tr><td>10Y-3Y 스프레드</td><td class="number">{kr_spread.get("value", 0):.2f}%</td><td>{'<span class="positive">정상</span>' if kr_spread.get("value", 0) > 0 else '<span class="negative">역전</span>'}</td></tr>
-                    <tr><td><strong>한미 금리차 (10Y)</strong></td><td class="number"><strong>{kr_us_spread.get("value", 0):.2f}%p</strong></td><td>{'<span class="negative">역전</span>' if kr_us_spread.get("value", 0) < 0 else '<span class="positive">정상</span>'}</td></tr>
+                    <tr><td>한은 기준금리</td><td class="number">{bok_base_v:.2f}%</td><td>{bok_base_chg}</td></tr>
+                    <tr><td>국고채 3년</td><td class="number">{kr_3y_v:.2f}%</td><td>{kr_3y_chg}</td></tr>
+                    <tr><td>국고채 10년</td><td class="number">{kr_10y_v:.2f}%</td><td>{kr_10y_chg}</td></tr>
+                    <tr><td>10Y-3Y 스프레드</td><td class="number">{kr_spread_v:.2f}%</td><td>{kr_spread_state}</td></tr>
+                    <tr><td><strong>한미 금리차 (10Y)</strong></td><td class="number"><strong>{kr_us_spread_v:.2f}%p</strong></td><td>{kr_us_spread_state}</td></tr>
                 </table>
                 <div class="macro-detail" style="margin-top: 10px;">
-                    {signal_box(sig_kr_us[0])} {sig_kr_us[1]}
+                    {sig_kr_us_box} {sig_kr_us[1]}
                 </div>
             </div>
             
             <div class="macro-card">
                 <div class="macro-title">Interest Rates (US Treasury)</div>
                 <table class="mini-table" style="width: 100%;">
-                    <tr><td>2Y Yield</td><td class="number">{us2y.get("value", 0):.2f}%</td><td>{fmt(us2y.get("change_pct", 0), "%")}</td></tr>
-                    <tr><td>10Y Yield</td><td class="number">{us10y.get("value", 0):.2f}%</td><td>{fmt(us10y.get("change_pct", 0), "%")}</td></tr>
-                    <tr><td>30Y Yield</td><td class="number">{us30y.get("value", 0):.2f}%</td><td>{fmt(us30y.get("change_pct", 0), "%")}</td></tr>
-                    <tr><td>10Y-2Y Spread</td><td class="number">{ind.get("yield_spread", 0):.2f}%</td><td>{'<span class="negative">역전</span>' if ind.get("yield_spread", 0) < 0 else '<span class="positive">정상</span>'}</td></tr>
+                    <tr><td>2Y Yield</td><td class="number">{us2y_v:.2f}%</td><td>{us2y_pct}</td></tr>
+                    <tr><td>10Y Yield</td><td class="number">{us10y_v:.2f}%</td><td>{us10y_pct}</td></tr>
+                    <tr><td>30Y Yield</td><td class="number">{us30y_v:.2f}%</td><td>{us30y_pct}</td></tr>
+                    <tr><td>10Y-2Y Spread</td><td class="number">{yield_spread:.2f}%</td><td>{yield_spread_state}</td></tr>
                 </table>
                 <div class="macro-detail" style="margin-top: 10px;">
-                    {signal_box(sig_10y[0])} {sig_10y[1]}
+                    {sig_10y_box} {sig_10y[1]}
                 </div>
             </div>
         </div>
@@ -347,26 +341,26 @@ body { font-family: 'Noto Serif KR', Georgia, serif; background: #f5f5f5; color:
             <div class="macro-card">
                 <div class="macro-title">Currency & Dollar Index</div>
                 <table class="mini-table" style="width: 100%;">
-                    <tr><td>DXY (Dollar Index)</td><td class="number">{dxy.get("value", 0):.2f}</td><td>{fmt(dxy.get("week_change_pct", 0), "%")}</td></tr>
-                    <tr><td>USD/KRW</td><td class="number">{usdkrw.get("value", 0):,.0f}</td><td>{fmt(usdkrw.get("week_change_pct", 0), "%")}</td></tr>
-                    <tr><td>EUR/USD</td><td class="number">{ind.get("eurusd", {}).get("value", 0):.4f}</td><td>{fmt(ind.get("eurusd", {}).get("week_change_pct", 0), "%")}</td></tr>
-                    <tr><td>USD/JPY</td><td class="number">{ind.get("usdjpy", {}).get("value", 0):.2f}</td><td>{fmt(ind.get("usdjpy", {}).get("week_change_pct", 0), "%")}</td></tr>
+                    <tr><td>DXY (Dollar Index)</td><td class="number">{dxy_v:.2f}</td><td>{dxy_wk}</td></tr>
+                    <tr><td>USD/KRW</td><td class="number">{usdkrw_v:,.0f}</td><td>{usdkrw_wk}</td></tr>
+                    <tr><td>EUR/USD</td><td class="number">{eurusd_v:.4f}</td><td>{eurusd_wk}</td></tr>
+                    <tr><td>USD/JPY</td><td class="number">{usdjpy_v:.2f}</td><td>{usdjpy_wk}</td></tr>
                 </table>
                 <div class="macro-detail" style="margin-top: 10px;">
-                    {signal_box(sig_dxy[0])} {sig_dxy[1]}<br>
-                    {signal_box(sig_krw[0])} {sig_krw[1]}
+                    {sig_dxy_box} {sig_dxy[1]}<br>
+                    {sig_krw_box} {sig_krw[1]}
                 </div>
             </div>
             
             <div class="macro-card">
                 <div class="macro-title">Volatility & Risk Sentiment</div>
                 <table class="mini-table" style="width: 100%;">
-                    <tr><td>VIX (Fear Index)</td><td class="number">{vix.get("value", 0):.2f}</td><td>{fmt(vix.get("week_change_pct", 0), "%")}</td></tr>
-                    <tr><td>MOVE (Bond Vol)</td><td class="number">{ind.get("move", {}).get("value", 0):.1f}</td><td>-</td></tr>
-                    <tr><td>1M Range (KOSPI)</td><td class="number" colspan="2">{ind.get("kospi", {}).get("low_1m", 0):,.0f} - {ind.get("kospi", {}).get("high_1m", 0):,.0f}</td></tr>
+                    <tr><td>VIX (Fear Index)</td><td class="number">{vix_v:.2f}</td><td>{vix_wk}</td></tr>
+                    <tr><td>MOVE (Bond Vol)</td><td class="number">{move_v:.1f}</td><td>-</td></tr>
+                    <tr><td>1M Range (KOSPI)</td><td class="number" colspan="2">{kospi_low:,.0f} - {kospi_high:,.0f}</td></tr>
                 </table>
                 <div class="macro-detail" style="margin-top: 10px;">
-                    {signal_box(sig_vix[0])} {sig_vix[1]}
+                    {sig_vix_box} {sig_vix[1]}
                 </div>
             </div>
         </div>
@@ -376,14 +370,14 @@ body { font-family: 'Noto Serif KR', Georgia, serif; background: #f5f5f5; color:
         <div class="macro-card">
             <div class="macro-title">Commodities & Crypto</div>
             <table class="mini-table" style="width: 100%;">
-                <tr><td>Gold</td><td class="number">${gold.get("value", 0):,.2f}</td><td>{fmt(gold.get("week_change_pct", 0), "%")}</td></tr>
-                <tr><td>WTI Crude</td><td class="number">${oil.get("value", 0):.2f}</td><td>{fmt(oil.get("week_change_pct", 0), "%")}</td></tr>
-                <tr><td>Copper</td><td class="number">${copper.get("value", 0):.2f}</td><td>{fmt(copper.get("week_change_pct", 0), "%")}</td></tr>
-                <tr><td>Bitcoin</td><td class="number">${btc.get("value", 0):,.0f}</td><td>{fmt(btc.get("week_change_pct", 0), "%")}</td></tr>
+                <tr><td>Gold</td><td class="number">${gold_v:,.2f}</td><td>{gold_wk}</td></tr>
+                <tr><td>WTI Crude</td><td class="number">${oil_v:.2f}</td><td>{oil_wk}</td></tr>
+                <tr><td>Copper</td><td class="number">${copper_v:.2f}</td><td>{copper_wk}</td></tr>
+                <tr><td>Bitcoin</td><td class="number">${btc_v:,.0f}</td><td>{btc_wk}</td></tr>
             </table>
             <div class="macro-detail" style="margin-top: 10px;">
-                {signal_box(sig_gold[0])} Gold: {sig_gold[1]}<br>
-                {signal_box(sig_oil[0])} Oil: {sig_oil[1]}
+                {sig_gold_box} Gold: {sig_gold[1]}<br>
+                {sig_oil_box} Oil: {sig_oil[1]}
             </div>
         </div>
         <div class="macro-card">
@@ -403,34 +397,34 @@ body { font-family: 'Noto Serif KR', Georgia, serif; background: #f5f5f5; color:
     <div class="highlight-box" style="margin-top: 20px;">
         <div class="highlight-title">Macro Signal Summary</div>
         <div class="indicator-grid">
-            <div class="indicator-item {signal_class(sig_kr_us[0])}">
+            <div class="indicator-item {sig_kr_us_class}">
                 <div class="indicator-name">한미 금리차</div>
-                <div class="indicator-value">{kr_us_spread.get("value", 0):.2f}%p</div>
+                <div class="indicator-value">{kr_us_spread_v:.2f}%p</div>
                 <div class="indicator-signal">{sig_kr_us[1]}</div>
             </div>
-            <div class="indicator-item {signal_class(sig_10y[0])}">
+            <div class="indicator-item {sig_10y_class}">
                 <div class="indicator-name">US 10Y</div>
-                <div class="indicator-value">{us10y.get("value", 0):.2f}%</div>
+                <div class="indicator-value">{us10y_v:.2f}%</div>
                 <div class="indicator-signal">{sig_10y[1]}</div>
             </div>
-            <div class="indicator-item {signal_class(sig_dxy[0])}">
+            <div class="indicator-item {sig_dxy_class}">
                 <div class="indicator-name">Dollar (DXY)</div>
-                <div class="indicator-value">{dxy.get("value", 0):.1f}</div>
+                <div class="indicator-value">{dxy_v:.1f}</div>
                 <div class="indicator-signal">{sig_dxy[1]}</div>
             </div>
-            <div class="indicator-item {signal_class(sig_krw[0])}">
+            <div class="indicator-item {sig_krw_class}">
                 <div class="indicator-name">USD/KRW</div>
-                <div class="indicator-value">{usdkrw.get("value", 0):,.0f}</div>
+                <div class="indicator-value">{usdkrw_v:,.0f}</div>
                 <div class="indicator-signal">{sig_krw[1]}</div>
             </div>
-            <div class="indicator-item {signal_class(sig_vix[0])}">
+            <div class="indicator-item {sig_vix_class}">
                 <div class="indicator-name">Volatility (VIX)</div>
-                <div class="indicator-value">{vix.get("value", 0):.1f}</div>
+                <div class="indicator-value">{vix_v:.1f}</div>
                 <div class="indicator-signal">{sig_vix[1]}</div>
             </div>
-            <div class="indicator-item {signal_class(sig_gold[0])}">
+            <div class="indicator-item {sig_gold_class}">
                 <div class="indicator-name">Gold</div>
-                <div class="indicator-value">${gold.get("value", 0):,.0f}</div>
+                <div class="indicator-value">${gold_v:,.0f}</div>
                 <div class="indicator-signal">{sig_gold[1]}</div>
             </div>
         </div>
@@ -438,210 +432,84 @@ body { font-family: 'Noto Serif KR', Georgia, serif; background: #f5f5f5; color:
 </div>
 '''
 
-    def _build_cycle_chart(self, claude, ind) -> str:
-        """산업 사이클 차트"""
-        cycle = claude.get("market_cycle", "MID_EXPANSION")
-        rotation = claude.get("rotation_signal", "NEUTRAL")
-        
-        # 사이클 위치 계산 (시계 방향: 12시=EARLY_EXPANSION)
-        cycle_positions = {
-            "EARLY_EXPANSION": {"angle": 0, "x": 120, "y": 20},
-            "MID_EXPANSION": {"angle": 45, "x": 200, "y": 60},
-            "LATE_EXPANSION": {"angle": 90, "x": 220, "y": 120},
-            "PEAK": {"angle": 135, "x": 200, "y": 180},
-            "EARLY_CONTRACTION": {"angle": 180, "x": 120, "y": 220},
-            "MID_CONTRACTION": {"angle": 225, "x": 40, "y": 180},
-            "LATE_CONTRACTION": {"angle": 270, "x": 20, "y": 120},
-            "TROUGH": {"angle": 315, "x": 40, "y": 60},
-            "RECESSION": {"angle": 180, "x": 120, "y": 220},
-        }
-        
-        pos = cycle_positions.get(cycle, cycle_positions["MID_EXPANSION"])
-        
-        # 각 사이클 단계별 추천 섹터
-        cycle_sectors = {
-            "EARLY_EXPANSION": "기술주, 소비재, 금융",
-            "MID_EXPANSION": "산업재, 소재, 에너지",
-            "LATE_EXPANSION": "에너지, 소재, 필수소비재",
-            "PEAK": "필수소비재, 헬스케어, 유틸리티",
-            "EARLY_CONTRACTION": "유틸리티, 헬스케어, 채권",
-            "RECESSION": "채권, 현금, 방어주",
-        }
-        
-        rec_sectors = cycle_sectors.get(cycle, "균형 포트폴리오")
-        
-        return f'''
+
+# 경제 캘린더 섹션 템플릿
+_CALENDAR_TMPL = '''
 <div class="section">
-    <div class="section-title">Business Cycle Analysis</div>
-    
-    <div class="two-column">
-        <div>
-            <div style="position: relative; width: 260px; height: 260px; margin: 0 auto;">
-                <!-- 사이클 원 -->
-                <svg width="260" height="260" style="position: absolute; top: 0; left: 0;">
-                    <circle cx="130" cy="130" r="100" fill="none" stroke="#ddd" stroke-width="2"/>
-                    <circle cx="130" cy="130" r="60" fill="none" stroke="#eee" stroke-width="1"/>
-                    
-                    <!-- 사분면 라인 -->
-                    <line x1="130" y1="30" x2="130" y2="230" stroke="#eee" stroke-width="1"/>
-                    <line x1="30" y1="130" x2="230" y2="130" stroke="#eee" stroke-width="1"/>
-                    
-                    <!-- 화살표 (시계방향) -->
-                    <path d="M 130 35 L 135 45 L 125 45 Z" fill="#999"/>
-                    <path d="M 225 130 L 215 135 L 215 125 Z" fill="#999"/>
-                    <path d="M 130 225 L 125 215 L 135 215 Z" fill="#999"/>
-                    <path d="M 35 130 L 45 125 L 45 135 Z" fill="#999"/>
-                    
-                    <!-- 현재 위치 표시 -->
-                    <circle cx="{pos['x']}" cy="{pos['y']}" r="8" fill="#222"/>
-                    <circle cx="{pos['x']}" cy="{pos['y']}" r="12" fill="none" stroke="#222" stroke-width="2"/>
-                </svg>
-                
-                <!-- 라벨 -->
-                <div style="position: absolute; top: 5px; left: 50%; transform: translateX(-50%); font-size: 10px; font-weight: 600; text-align: center;">
-                    EARLY<br>EXPANSION
-                </div>
-                <div style="position: absolute; top: 50%; right: 0; transform: translateY(-50%); font-size: 10px; font-weight: 600; text-align: center;">
-                    LATE<br>EXPANSION
-                </div>
-                <div style="position: absolute; bottom: 5px; left: 50%; transform: translateX(-50%); font-size: 10px; font-weight: 600; text-align: center;">
-                    CONTRACTION
-                </div>
-                <div style="position: absolute; top: 50%; left: 0; transform: translateY(-50%); font-size: 10px; font-weight: 600; text-align: center;">
-                    RECOVERY
-                </div>
-                
-                <!-- 중앙 텍스트 -->
-                <div style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); text-align: center;">
-                    <div style="font-size: 11px; font-weight: 700; color: #222;">CURRENT</div>
-                    <div style="font-size: 14px; font-weight: 700; color: #222; margin-top: 3px;">{cycle.replace("_", " ")}</div>
-                </div>
-            </div>
-        </div>
-        
-        <div>
-            <div class="macro-card">
-                <div class="macro-title">Current Cycle Position</div>
-                <div class="macro-value" style="font-size: 18px;">{cycle.replace("_", " ")}</div>
-                <div class="macro-detail" style="margin-top: 10px;">
-                    <strong>Rotation Signal:</strong> 
-                    <span class="signal-box {'signal-bullish' if rotation == 'RISK_ON' else 'signal-bearish' if rotation == 'RISK_OFF' else 'signal-neutral'}">{rotation}</span>
-                </div>
-            </div>
-            
-            <div class="macro-card">
-                <div class="macro-title">Recommended Sectors</div>
-                <div class="macro-detail">{rec_sectors}</div>
-            </div>
-            
-            <div class="macro-card">
-                <div class="macro-title">Cycle Characteristics</div>
-                <div class="macro-detail" style="font-size: 12px; line-height: 1.6;">
-                    {'• GDP 성장 가속<br>• 기업이익 개선<br>• 금리 상승 초기<br>• 주식 > 채권' if 'EXPANSION' in cycle else 
-                     '• GDP 성장 둔화<br>• 기업이익 정체<br>• 금리 고점<br>• 방어주 선호' if 'CONTRACTION' in cycle or 'RECESSION' in cycle else
-                     '• 경기 바닥 확인<br>• 정책 완화 기대<br>• 선행지표 개선<br>• 성장주 매수 기회'}
-                </div>
-            </div>
-        </div>
-    </div>
-</div>
-'''
-
-    def _build_calendar_section(self, calendar) -> str:
-        us_events = calendar.get("us_events", [])
-        kr_events = calendar.get("kr_events", [])
-        earnings = calendar.get("earnings", [])
-        
-        us_html = ""
-        for e in us_events[:5]:
-            imp_class = "importance-high" if e.get("importance") == "HIGH" else ""
-            us_html += f'<div class="calendar-item"><span class="calendar-date">{e.get("date", "")}</span> <span class="calendar-event {imp_class}">{e.get("event", "")}</span></div>'
-        
-        kr_html = ""
-        for e in kr_events[:5]:
-            imp_class = "importance-high" if e.get("importance") == "HIGH" else ""
-            kr_html += f'<div class="calendar-item"><span class="calendar-date">{e.get("date", "")}</span> <span class="calendar-event {imp_class}">{e.get("event", "")}</span></div>'
-        
-        earn_html = ""
-        for e in earnings[:6]:
-            earn_html += f'<div class="calendar-item"><span class="calendar-date">{e.get("date", "")}</span> {e.get("company", "")} ({e.get("market", "")})</div>'
-        
-        return f'''
-<div class="section">
-    <div class="section-title">Economic Calendar</div>
-    <div class="three-column">
-        <div>
-            <p class="body-text"><strong>US Events</strong></p>
-            {us_html if us_html else '<p style="color: #888;">No events</p>'}
-        </div>
-        <div>
-            <p class="body-text"><strong>Korea Events</strong></p>
-            {kr_html if kr_html else '<p style="color: #888;">No events</p>'}
-        </div>
-        <div>
-            <p class="body-text"><strong>Earnings</strong></p>
-            {earn_html if earn_html else '<p style="color: #888;">No earnings</p>'}
-        </div>
-    </div>
-</div>
-'''
-
-    def _build_sector_section(self, kr_sectors, claude) -> str:
-        top_sectors = claude.get("top_sectors", [])
-        avoid_sectors = claude.get("avoid_sectors", [])
-        themes = claude.get("key_themes", [])
-        
-        sector_html = ""
-        for s in kr_sectors[:12]:
-            perf = s.get("perf_month", 0)
-            color_class = "positive" if perf > 0 else "negative" if perf < 0 else ""
-            sector_html += f'''
-            <div class="sector-item">
-                <div class="sector-name">{s.get("name", "")}</div>
-                <div class="sector-perf {color_class}">{perf:+.1f}%</div>
-            </div>'''
-        
-        top_html = ""
-        for s in top_sectors[:3]:
-            top_html += f'''
-            <tr>
-                <td><strong>{s.get("name", "")}</strong></td>
-                <td class="number">{s.get("score", 0)}</td>
-                <td style="font-size: 12px;">{s.get("reasoning", "")[:70]}...</td>
-            </tr>'''
-        
-        avoid_html = ""
-        for s in avoid_sectors[:2]:
-            avoid_html += f'''
-            <tr>
-                <td><strong>{s.get("name", "")}</strong></td>
-                <td class="number">{s.get("score", 0)}</td>
-                <td style="font-size: 12px;">{s.get("reasoning", "")[:50]}...</td>
-            </tr>'''
-        
-        themes_text = " · ".join(themes) if themes else "-"
-        
-        return f'''
-<div class="section">
-    <div class="section-title">Sector Analysis</div>
-    <p class="body-text"><strong>Monthly Performance</strong></p>
-    <div class="four-column" style="margin-bottom: 20px;">
-        {sector_html}
-    </div>
+    <div class="section-title">Economic Calendar</div>
+    <div class="three-column">
+        <div>
+            <p class="body-text"><strong>US Events</strong></p>
+            {us_html}
+        </div>
+        <div>
+            <p class="body-text"><strong>Korea Events</strong></p>
+            {kr_html}
+        </div>
+        <div>
+            <p class="body-text"><strong>Earnings</strong></p>
+            {earn_html}
+        </div>
+    </div>
+</div>
+'''
+
+
+# 섹터 분석 섹션 템플릿 (추천/회피 섹터가 없으면 빈 행)
+_EMPTY_TABLE_ROW = '<tr><td colspan="3">-</td></tr>'
+
+# 섹터 행 템플릿 (등락률 카드, 추천/회피 섹터 표)
+_SECTOR_PERF_ROW = '''
+            <div class="sector-item">
+                <div class="sector-name">{name}</div>
+                <div class="sector-perf {color_cls}">{perf:+.1f}%</div>
+            </div>'''
+_SECTOR_PICK_ROW = '''
+            <tr>
+                <td><strong>{name}</strong></td>
+                <td class="number">{score}</td>
+                <td style="font-size: 12px;">{reasoning}...</td>
+            </tr>'''
+
+
+def _sector_perf_row(s):
+    perf = s.get("perf_month", 0)
+    return _SECTOR_PERF_ROW.format(
+        name=_h(s.get("name", "")),
+        color_cls="positive" if perf > 0 else "negative" if perf < 0 else "",
+        perf=perf,
+    )
+
+
+def _sector_pick_row(s, reason_len):
+    return _SECTOR_PICK_ROW.format(
+        name=_h(s.get("name", "")),
+        score=_h(s.get("score", 0)),
+        reasoning=_h(s.get("reasoning", "")[:reason_len]),
+    )
+
+
+_SECTOR_TMPL = '''
+<div class="section">
+    <div class="section-title">Sector Analysis</div>
+    <p class="body-text"><strong>Monthly Performance</strong></p>
+    <div class="four-column" style="margin-bottom: 20px;">
+        {sector_html}
+    </div>
     
     <div class="two-column">
         <div>
             <p class="body-text"><strong>Overweight</strong></p>
             <table class="data-table">
                 <tr><th>Sector</th><th>Score</th><th>Rationale</th></tr>
-                {top_html if top_html else '<tr><td colspan="3">-</td></tr>'}
+                {top_html}
             </table>
         </div>
         <div>
             <p class="body-text"><strong>Underweight</strong></p>
             <table class="data-table">
                 <tr><th>Sector</th><th>Score</th><th>Risk</th></tr>
-                {avoid_html if avoid_html else '<tr><td colspan="3">-</td></tr>'}
+                {avoid_html}
             </table>
         </div>
     </div>
@@ -650,23 +518,61 @@ body { font-family: 'Noto Serif KR', Georgia, serif; background: #f5f5f5; color:
 </div>
 '''
 
-    def _build_quantlib_section(self, quantlib) -> str:
-        if not quantlib:
-            return ""
-        
-        vasicek = quantlib.get("vasicek", {})
-        yield_curve = quantlib.get("yield_curve", {})
-        volatility = quantlib.get("volatility", {})
-        bond = quantlib.get("bond_10y", {})
-        
+
+class QuantLibView(NamedTuple):
+    """리포트 표시용 종합 분석 요약 (comprehensive_analysis 결과에서 한 번만 추출)"""
+    r0: float
+    theta: float
+    kappa: float
+    half_life: float
+    curve_shape: str
+    slope_bps: float
+    short_rate: float
+    long_rate: float
+    curve_interp: str
+    vol_atm: float
+    skew: float
+    risk_reversal: float
+    term_shape: str
+    vol_interp: str
+    rate_path: str
+    bond_price: float
+    bond_duration: float
+    bond_convexity: float
+
+    @classmethod
+    def from_analysis(cls, analysis: Dict) -> "QuantLibView":
+        vasicek = analysis.get("vasicek", {})
+        yield_curve = analysis.get("yield_curve", {})
+        volatility = analysis.get("volatility", {})
+        bond = analysis.get("bond_10y", {})
         vas_params = vasicek.get("parameters", {})
         vas_path = vasicek.get("expected_path", {})
-        
-        vol_atm = volatility.get("atm_volatility", 0)
         vol_skew = volatility.get("skew_metrics", {})
-        vol_interp = volatility.get("skew_interpretation", "")
-        
-        return f'''
+        return cls(
+            r0=vas_params.get("r0", 0),
+            theta=vas_params.get("theta", 0),
+            kappa=vas_params.get("kappa", 0),
+            half_life=vasicek.get("half_life_years", 0),
+            curve_shape=yield_curve.get("curve_shape", "N/A"),
+            slope_bps=yield_curve.get("slope_bps", 0),
+            short_rate=yield_curve.get("short_rate", 0),
+            long_rate=yield_curve.get("long_rate", 0),
+            curve_interp=yield_curve.get("interpretation", ""),
+            vol_atm=volatility.get("atm_volatility", 0),
+            skew=vol_skew.get("skew", 0),
+            risk_reversal=vol_skew.get("risk_reversal", 0),
+            term_shape=volatility.get("term_shape", "N/A"),
+            vol_interp=volatility.get("skew_interpretation", ""),
+            rate_path=" → ".join(f"{k}: {v}%" for k, v in islice(vas_path.items(), 5)),
+            bond_price=bond.get("price", 0),
+            bond_duration=bond.get("modified_duration", 0),
+            bond_convexity=bond.get("convexity", 0),
+        )
+
+
+# QuantLib 분석 섹션 템플릿 (v: QuantLibView)
+_QUANTLIB_TMPL = '''
 <div class="section">
     <div class="section-title">Quantitative Analysis (QuantLib)</div>
     
@@ -674,56 +580,59 @@ body { font-family: 'Noto Serif KR', Georgia, serif; background: #f5f5f5; color:
         <div class="macro-card">
             <div class="macro-title">Vasicek Rate Model</div>
             <table class="mini-table" style="width: 100%;">
-                <tr><td>Current (r₀)</td><td class="number">{vas_params.get("r0", 0)}%</td></tr>
-                <tr><td>Long-term (θ)</td><td class="number">{vas_params.get("theta", 0)}%</td></tr>
-                <tr><td>Mean Rev. (κ)</td><td class="number">{vas_params.get("kappa", 0)}</td></tr>
-                <tr><td>Half-life</td><td class="number">{vasicek.get("half_life_years", 0)}Y</td></tr>
+                <tr><td>Current (r₀)</td><td class="number">{v.r0}%</td></tr>
+                <tr><td>Long-term (θ)</td><td class="number">{v.theta}%</td></tr>
+                <tr><td>Mean Rev. (κ)</td><td class="number">{v.kappa}</td></tr>
+                <tr><td>Half-life</td><td class="number">{v.half_life}Y</td></tr>
             </table>
         </div>
         
         <div class="macro-card">
             <div class="macro-title">Yield Curve</div>
             <table class="mini-table" style="width: 100%;">
-                <tr><td>Shape</td><td><strong>{yield_curve.get("curve_shape", "N/A")}</strong></td></tr>
-                <tr><td>Slope</td><td class="number">{yield_curve.get("slope_bps", 0):.0f} bps</td></tr>
-                <tr><td>Short Rate</td><td class="number">{yield_curve.get("short_rate", 0)}%</td></tr>
-                <tr><td>Long Rate</td><td class="number">{yield_curve.get("long_rate", 0)}%</td></tr>
+                <tr><td>Shape</td><td><strong>{v.curve_shape}</strong></td></tr>
+                <tr><td>Slope</td><td class="number">{v.slope_bps:.0f} bps</td></tr>
+                <tr><td>Short Rate</td><td class="number">{v.short_rate}%</td></tr>
+                <tr><td>Long Rate</td><td class="number">{v.long_rate}%</td></tr>
             </table>
-            <div class="macro-detail" style="margin-top: 8px; font-size: 11px;">{yield_curve.get("interpretation", "")}</div>
+            <div class="macro-detail" style="margin-top: 8px; font-size: 11px;">{v.curve_interp}</div>
         </div>
         
         <div class="macro-card">
             <div class="macro-title">Volatility Surface</div>
             <table class="mini-table" style="width: 100%;">
-                <tr><td>ATM Vol</td><td class="number">{vol_atm}%</td></tr>
-                <tr><td>Skew</td><td class="number">{vol_skew.get("skew", 0)}%</td></tr>
-                <tr><td>Risk Rev.</td><td class="number">{vol_skew.get("risk_reversal", 0)}%</td></tr>
-                <tr><td>Term</td><td>{volatility.get("term_shape", "N/A")}</td></tr>
+                <tr><td>ATM Vol</td><td class="number">{v.vol_atm}%</td></tr>
+                <tr><td>Skew</td><td class="number">{v.skew}%</td></tr>
+                <tr><td>Risk Rev.</td><td class="number">{v.risk_reversal}%</td></tr>
+                <tr><td>Term</td><td>{v.term_shape}</td></tr>
             </table>
-            <div class="macro-detail" style="margin-top: 8px; font-size: 11px;">{vol_interp}</div>
+            <div class="macro-detail" style="margin-top: 8px; font-size: 11px;">{v.vol_interp}</div>
         </div>
     </div>
     
     <div class="highlight-box" style="margin-top: 15px;">
         <div class="highlight-title">Rate Path Forecast (Vasicek)</div>
         <p class="body-text" style="font-size: 12px;">
-            {' → '.join([f"{k}: {v}%" for k, v in list(vas_path.items())[:5]])}
+            {v.rate_path}
         </p>
         <p class="body-text" style="font-size: 11px; color: #666; margin-top: 5px;">
-            10Y Bond: Price {bond.get("price", 0):,.0f} | Duration {bond.get("modified_duration", 0):.2f} | Convexity {bond.get("convexity", 0):.1f}
+            10Y Bond: Price {v.bond_price:,.0f} | Duration {v.bond_duration:.2f} | Convexity {v.bond_convexity:.1f}
         </p>
     </div>
 </div>
 '''
 
-    def _build_risk_section(self, risk_m, quantlib) -> str:
-        level = risk_m.get("risk_level", "MEDIUM")
-        score = risk_m.get("risk_score", 50)
-        move = risk_m.get("move_value", 0)
-        vix = risk_m.get("vix_value", 0)
-        vol_mult = risk_m.get("vol_multiplier", 1.0)
-        
-        return f'''
+
+# 리스크 점수 구간 경계 (이상) 및 구간별 코멘트
+_RISK_COMMENT_EDGES = (40, 70)
+_RISK_COMMENTS = (
+    "시장 변동성이 낮습니다. 적극적인 포지션 확대를 고려할 수 있습니다.",
+    "변동성이 보통 수준입니다. 기존 포지션을 유지하되 주요 지표를 모니터링하십시오.",
+    "현재 시장 변동성이 높습니다. 포지션 규모를 축소하고 손절 라인을 타이트하게 설정하십시오.",
+)
+
+# 리스크 평가 섹션 템플릿
+_RISK_TMPL = '''
 <div class="section">
     <div class="section-title">Risk Assessment</div>
     <div class="two-column">
@@ -740,9 +649,7 @@ body { font-family: 'Noto Serif KR', Georgia, serif; background: #f5f5f5; color:
             <div class="highlight-box">
                 <div class="highlight-title">Risk Commentary</div>
                 <p class="body-text" style="font-size: 12px;">
-                    {'현재 시장 변동성이 높습니다. 포지션 규모를 축소하고 손절 라인을 타이트하게 설정하십시오.' if score >= 70 else 
-                     '변동성이 보통 수준입니다. 기존 포지션을 유지하되 주요 지표를 모니터링하십시오.' if score >= 40 else
-                     '시장 변동성이 낮습니다. 적극적인 포지션 확대를 고려할 수 있습니다.'}
+                    {commentary}
                 </p>
             </div>
         </div>
@@ -751,46 +658,9 @@ body { font-family: 'Noto Serif KR', Georgia, serif; background: #f5f5f5; color:
 '''
 
 
-    def _build_recommendation_section(self, alloc, decision) -> str:
-        """투자 추천 섹션"""
-        score = decision.get("score", 50)
-        dec = decision.get("decision", "HOLD")
-        action = decision.get("action", "")
-        signals = decision.get("signals", {})
-        recs = decision.get("recommendations", {})
-        
-        # 자산배분 바 색상
-        colors = {
-            "주식": "#222",
-            "채권": "#666",
-            "현금": "#bbb",
-        }
-        
-        alloc_bar = ""
-        for asset, pct in alloc.items():
-            color = colors.get(asset, "#999")
-            alloc_bar += f'<div class="allocation-segment" style="width: {pct}%; background: {color};"></div>'
-        
-        alloc_legend = " · ".join([f"{k} {v}%" for k, v in alloc.items()])
-        
-        # 시그널 요약
-        signal_html = ""
-        signal_labels = {
-            "macro": "Macro",
-            "risk": "Risk",
-            "sentiment": "Sentiment",
-            "rotation": "Rotation",
-        }
-        for key, label in signal_labels.items():
-            val = signals.get(key, "N/A")
-            cls = "signal-bullish" if val in ["BULLISH", "LOW", "POSITIVE", "RISK_ON"] else \
-                  "signal-bearish" if val in ["BEARISH", "HIGH", "NEGATIVE", "RISK_OFF"] else "signal-neutral"
-            signal_html += f'<span class="signal-box {cls}" style="margin-right: 8px;">{label}: {val}</span>'
-        
-        # 결정 색상
-        dec_class = "positive" if dec in ["STRONG_BUY", "BUY"] else "negative" if dec in ["SELL", "REDUCE"] else ""
-        
-        return f'''
+# 투자 추천 섹션 템플릿 (리스크 경고 박스는 해당 시에만)
+_RISK_WARNING_HTML = '<div class="highlight-box" style="margin-top: 20px; border-left-color: #b71c1c;"><div class="highlight-title" style="color: #b71c1c;">Risk Warning</div><p class="body-text" style="font-size: 12px;">현재 리스크 점수가 높습니다. 포지션 규모를 축소하고 손절 라인을 엄격히 준수하십시오.</p></div>'
+_RECOMMENDATION_TMPL = '''
 <div class="section">
     <div class="section-title">Investment Recommendation</div>
     
@@ -815,28 +685,28 @@ body { font-family: 'Noto Serif KR', Georgia, serif; background: #f5f5f5; color:
     <div class="two-column" style="margin-top: 20px;">
         <div>
             <p class="body-text"><strong>Primary Sector</strong></p>
-            <p style="font-size: 16px; font-weight: 600;">{recs.get("primary_sector", "N/A")}</p>
-            <p style="font-size: 12px; color: #666; margin-top: 5px;">Position Size: {recs.get("position_size", "10%")}</p>
+            <p style="font-size: 16px; font-weight: 600;">{primary_sector}</p>
+            <p style="font-size: 12px; color: #666; margin-top: 5px;">Position Size: {position_size}</p>
         </div>
         <div>
             <p class="body-text"><strong>Key Catalysts</strong></p>
             <ul style="font-size: 12px; color: #444; padding-left: 18px; margin-top: 5px;">
-                {"".join([f"<li>{c}</li>" for c in recs.get("catalysts", [])[:3]]) or "<li>-</li>"}
+                {catalysts_html}
             </ul>
         </div>
     </div>
     
-    {f'<div class="highlight-box" style="margin-top: 20px; border-left-color: #b71c1c;"><div class="highlight-title" style="color: #b71c1c;">Risk Warning</div><p class="body-text" style="font-size: 12px;">현재 리스크 점수가 높습니다. 포지션 규모를 축소하고 손절 라인을 엄격히 준수하십시오.</p></div>' if decision.get("risk_warning") else ""}
+    {risk_warning}
 </div>
 '''
 
-    def _build_footer(self, ts) -> str:
-        """푸터 섹션"""
-        return f'''
+
+# 푸터 템플릿 (생성 시각만 채움 - 면책 문구 등은 고정)
+_FOOTER_TMPL = '''
 <div class="footer">
     <div class="two-column">
         <div>
-            <p>Generated: {ts.strftime("%Y-%m-%d %H:%M:%S KST")}</p>
+            <p>Generated: {generated}</p>
             <p>AI Investment Research System v2.0</p>
         </div>
         <div style="text-align: right;">
@@ -856,3 +726,550 @@ body { font-family: 'Noto Serif KR', Georgia, serif; background: #f5f5f5; color:
 </body>
 </html>
 '''
+
+
+@lru_cache(maxsize=8)
+def _render_footer(generated: str) -> str:
+    """생성 시각(초 단위 문자열)별 푸터 - 같은 시각 재생성 시 캐시"""
+    return _FOOTER_TMPL.format(generated=generated)
+
+
+# 같은 주 동일 입력 재실행 시 재사용하는 HTML 캐시 (report_dir 하위, 7일 TTL, 최근 32건 유지)
+REPORT_CACHE_SUBDIR = ".cache"
+REPORT_CACHE_TTL = 7 * 86400
+REPORT_CACHE_SIZE = 32
+_CACHE_SUFFIX = ".body.html"
+
+
+def _render_version() -> str:
+    """렌더링 코드/템플릿 버전 - 이 모듈 소스가 바뀌면 이전 캐시는 무효"""
+    try:
+        with open(__file__, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+    except OSError:
+        return ""
+
+
+_RENDER_VERSION = _render_version()
+
+
+# 한 번의 writev에 넘길 수 있는 최대 버퍼 수
+_IOV_MAX = os.sysconf("SC_IOV_MAX") if hasattr(os, "sysconf") else 1024
+
+
+def _write_fragments(path: str, fragments: Sequence[str]) -> None:
+    """
+    HTML 조각들을 합치지 않고 각각 인코딩해 writev 한 번으로 기록
+
+    writev가 없는 플랫폼(Windows)은 결합 후 write로 대체
+    """
+    bufs = [memoryview(f.encode("utf-8")) for f in fragments]
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if hasattr(os, "writev"):
+            while bufs:
+                n = os.writev(fd, bufs[:_IOV_MAX])
+                # 다 쓴 버퍼는 버리고 부분 기록된 버퍼는 남은 부분부터
+                i = 0
+                while i < len(bufs) and n >= len(bufs[i]):
+                    n -= len(bufs[i])
+                    i += 1
+                bufs = bufs[i:]
+                if n:
+                    bufs[0] = bufs[0][n:]
+        else:
+            data = memoryview(b"".join(bufs))
+            while data:
+                data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+_VOLATILE_KEYS = frozenset(("timestamp", "ts_ns"))
+
+
+def _strip_volatile(obj):
+    """해시 대상에서 실행 시각(timestamp, ts_ns) 필드 제거 - 내용이 같으면 같은 키"""
+    if isinstance(obj, dict):
+        return {k: _strip_volatile(v) for k, v in obj.items() if k not in _VOLATILE_KEYS}
+    if isinstance(obj, (list, tuple)):
+        return [_strip_volatile(v) for v in obj]
+    return obj
+
+
+def _report_key(analysis: Dict, decision: Dict, portfolio_value: float, week_start: datetime) -> Optional[str]:
+    """리포트 입력 스냅샷 + 렌더링 버전 해시 (주 단위)"""
+    try:
+        payload = json.dumps(
+            [_RENDER_VERSION, _strip_volatile(analysis), _strip_volatile(decision),
+             portfolio_value, week_start.date()],
+            sort_keys=True, default=str,
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ReportGenerator:
+    def __init__(self):
+        self.report_dir = "reports"
+        self.cache_dir = os.path.join(self.report_dir, REPORT_CACHE_SUBDIR)
+        os.makedirs(self.report_dir, exist_ok=True)
+    
+    def save_report(self, html: Union[str, List[str]], filename: str = None) -> str:
+        """
+        리포트 저장 - 완성된 HTML 문자열 또는 generate_html_parts()의 조각 리스트
+        """
+        if not filename:
+            filename = datetime.now().strftime(_FMT_FILENAME)
+        path = os.path.join(self.report_dir, filename)
+        
+        # 텍스트 I/O 계층 없이 fd에 직접 기록 (조각은 결합하지 않고 writev)
+        _write_fragments(path, [html] if isinstance(html, str) else html)
+        return path
+
+    def _load_cached(self, path: str) -> Optional[str]:
+        try:
+            with open(path, encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _store_cached(self, path: str, parts: List[str]) -> None:
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            _write_fragments(tmp_path, parts)
+            os.replace(tmp_path, path)
+            self._prune_cache()
+        except OSError:
+            pass
+
+    def _prune_cache(self) -> None:
+        """만료 항목 제거 후 최신 순으로 최대 개수만 유지"""
+        now = time.time()
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(_CACHE_SUFFIX):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        pass
+        entries.sort(reverse=True)
+        for i, (mtime, path) in enumerate(entries):
+            if i >= REPORT_CACHE_SIZE or now - mtime >= REPORT_CACHE_TTL:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def generate_html_report(self, analysis: Dict, decision: Dict, portfolio_value: float) -> str:
+        return "".join(self.generate_html_parts(analysis, decision, portfolio_value))
+
+    def generate_html_parts(self, analysis: Dict, decision: Dict, portfolio_value: float) -> List[str]:
+        """
+        리포트를 섹션별 HTML 조각 리스트로 생성 (save_report로 결합 없이 기록)
+        """
+        ts = datetime.now()
+        week_start = ts - timedelta(days=ts.weekday())
+        week_end = week_start + timedelta(days=4)
+        
+        # 생성 시각이 들어가는 머리말/푸터는 매번 새로 생성
+        head = [self._get_styles(), self._build_header(ts, week_start, week_end, decision)]
+        tail = [self._build_footer(ts)]
+        
+        # 같은 주에 입력이 같으면 이전에 만든 본문 섹션을 그대로 사용
+        key = _report_key(analysis, decision, portfolio_value, week_start)
+        cache_path = os.path.join(self.cache_dir, key + _CACHE_SUFFIX) if key else None
+        if cache_path:
+            cached = self._load_cached(cache_path)
+            if cached is not None:
+                return head + [cached] + tail
+        
+        macro = analysis.get("macro", {})
+        industry = analysis.get("industry", {})
+        risk = analysis.get("risk", {})
+        sentiment = analysis.get("sentiment", {})
+        
+        ind = macro.get("indicators", {})
+        corr = macro.get("correlations", {})
+        calendar = macro.get("calendar", {})
+        claude = industry.get("claude_analysis", {})
+        risk_m = risk.get("risk_metrics", {})
+        quantlib = risk.get("quantlib", {})
+        kr_sectors = industry.get("kr_sectors", [])
+        alloc = decision.get("allocation", {})
+        
+        # 본문 섹션 조각 (입력이 비어 있는 섹션은 대체 문구)
+        body = [
+            self._build_executive_summary(macro, claude, decision),
+            self._build_macro_dashboard(ind, quantlib) if ind else _NO_MACRO_DASHBOARD,
+            self._build_macro_analysis(ind, macro) if ind else _NO_MACRO_ANALYSIS,
+            self._build_cycle_chart(claude, ind),
+            self._build_calendar_section(calendar) if calendar else _NO_CALENDAR,
+            self._build_sector_section(kr_sectors, claude) if kr_sectors or claude else _NO_SECTORS,
+            self._build_quantlib_section(quantlib),
+            self._build_risk_section(risk_m, quantlib),
+            self._build_recommendation_section(alloc, decision),
+        ]
+        
+        if cache_path:
+            self._store_cached(cache_path, body)
+        return head + body + tail
+
+    def _get_styles(self) -> str:
+        return _STYLES_HTML
+
+    def _build_header(self, ts, week_start, week_end, decision) -> str:
+        decision_text = {
+            "STRONG_BUY": "Risk-On: 위험자산 적극 매수 권고",
+            "BUY": "Overweight: 위험자산 비중 확대 권고",
+            "HOLD": "Neutral: 현 포지션 유지 권고",
+            "REDUCE": "Underweight: 위험자산 비중 축소 권고",
+            "SELL": "Risk-Off: 방어적 포지션 전환 권고"
+        }
+        headline = decision_text.get(decision.get('decision', ''), 'Weekly Market Review')
+        
+        return f'''
+<div class="masthead">
+    <div class="masthead-title">Weekly Investment Report</div>
+    <div class="masthead-date">Week of {week_start.strftime(_FMT_WEEK_START)} - {week_end.strftime(_FMT_WEEK_END)} | Seoul</div>
+</div>
+<div class="headline">{headline}</div>
+<div class="subheadline">Score {decision.get('score', 0)}/100 · {decision.get('decision', 'N/A')}</div>
+<div class="byline">AI Investment Research · Macro + QuantLib Analysis</div>
+'''
+
+    def _build_executive_summary(self, macro, claude, decision) -> str:
+        rec = macro.get("recommendation", "")
+        cycle = _h(claude.get("market_cycle", "N/A").replace("_", " "))
+        cycle_reason = _h(claude.get("cycle_reasoning", ""))
+        trading_idea = _h(claude.get("trading_idea", ""))
+        policy = _h(claude.get("policy_impact", ""))
+        
+        return f'''
+<div class="section">
+    <div class="section-title">Executive Summary</div>
+    <p class="lead">{rec}</p>
+    <p class="body-text"><strong>Market Cycle:</strong> {cycle}. {cycle_reason}</p>
+    <p class="body-text">{trading_idea}</p>
+    <p class="body-text">{policy}</p>
+</div>
+'''
+
+    def _build_macro_dashboard(self, ind, quantlib) -> str:
+        """매크로 대시보드 - 핵심 지표 한눈에"""
+        # 지표별 dict는 한 번만 조회하고 필드는 지역 변수로 바인딩
+        kospi = _g(ind, "kospi")
+        sp500 = _g(ind, "sp500")
+        usdkrw = _g(ind, "usdkrw")
+        dxy = _g(ind, "dxy")
+        vix = _g(ind, "vix")
+        us10y = _g(ind, "us_10y")
+        gold = _g(ind, "gold")
+        
+        kospi_v, kospi_wk = kospi.get("value", 0), kospi.get("week_change_pct", 0)
+        sp500_v, sp500_wk = sp500.get("value", 0), sp500.get("week_change_pct", 0)
+        usdkrw_v, usdkrw_wk = usdkrw.get("value", 0), usdkrw.get("week_change_pct", 0)
+        dxy_v, dxy_wk = dxy.get("value", 0), dxy.get("week_change_pct", 0)
+        vix_v, vix_wk = vix.get("value", 0), vix.get("week_change_pct", 0)
+        us10y_v, us10y_pct = us10y.get("value", 0), us10y.get("change_pct", 0)
+        gold_v, gold_wk = gold.get("value", 0), gold.get("week_change_pct", 0)
+        
+        # 한국 금리
+        bok_base = _g(ind, "bok_base")
+        kr_10y = _g(ind, "kr_10y")
+        bok_base_v, bok_base_chg = bok_base.get("value", 0), bok_base.get("change", 0)
+        kr_10y_v, kr_10y_chg = kr_10y.get("value", 0), kr_10y.get("change", 0)
+        kr_us_spread_v = _g(ind, "kr_us_spread").get("value", 0)
+        
+        return f'''
+<div class="section">
+    <div class="section-title">Macro Dashboard</div>
+    <div class="five-column">
+        <div class="stat-box">
+            <div class="stat-value">{kospi_v:,.0f}</div>
+            <div class="stat-label">KOSPI</div>
+            <div class="stat-change">{_fmt(kospi_wk, "%")}</div>
+        </div>
+        <div class="stat-box">
+            <div class="stat-value">{sp500_v:,.0f}</div>
+            <div class="stat-label">S&P 500</div>
+            <div class="stat-change">{_fmt(sp500_wk, "%")}</div>
+        </div>
+        <div class="stat-box">
+            <div class="stat-value">{bok_base_v:.2f}%</div>
+            <div class="stat-label">한은 기준금리</div>
+            <div class="stat-change">{_fmt(bok_base_chg, "%p")}</div>
+        </div>
+        <div class="stat-box">
+            <div class="stat-value">{kr_10y_v:.2f}%</div>
+            <div class="stat-label">국고채 10Y</div>
+            <div class="stat-change">{_fmt(kr_10y_chg, "%p")}</div>
+        </div>
+        <div class="stat-box">
+            <div class="stat-value">{kr_us_spread_v:.2f}%p</div>
+            <div class="stat-label">한미 금리차</div>
+            <div class="stat-change">{'<span class="negative">역전</span>' if kr_us_spread_v < 0 else '<span class="positive">정상</span>'}</div>
+        </div>
+    </div>
+    <div class="five-column" style="margin-top: 12px;">
+        <div class="stat-box">
+            <div class="stat-value">{us10y_v:.2f}%</div>
+            <div class="stat-label">US 10Y</div>
+            <div class="stat-change">{_fmt(us10y_pct, "%")}</div>
+        </div>
+        <div class="stat-box">
+            <div class="stat-value">{usdkrw_v:,.0f}</div>
+            <div class="stat-label">USD/KRW</div>
+            <div class="stat-change">{_fmt(usdkrw_wk, "%")}</div>
+        </div>
+        <div class="stat-box">
+            <div class="stat-value">{dxy_v:.1f}</div>
+            <div class="stat-label">DXY</div>
+            <div class="stat-change">{_fmt(dxy_wk, "%")}</div>
+        </div>
+        <div class="stat-box">
+            <div class="stat-value">{vix_v:.1f}</div>
+            <div class="stat-label">VIX</div>
+            <div class="stat-change">{_fmt(vix_wk, "%")}</div>
+        </div>
+        <div class="stat-box">
+            <div class="stat-value">${gold_v:,.0f}</div>
+            <div class="stat-label">Gold</div>
+            <div class="stat-change">{_fmt(gold_wk, "%")}</div>
+        </div>
+    </div>
+</div>
+'''
+
+    def _build_macro_analysis(self, ind, macro) -> str:
+        """상세 매크로 분석"""
+        # 한국 금리
+        bok_base = _g(ind, "bok_base")
+        kr_3y = _g(ind, "kr_3y")
+        kr_10y = _g(ind, "kr_10y")
+        bok_base_v, bok_base_chg = bok_base.get("value", 0), bok_base.get("change", 0)
+        kr_3y_v, kr_3y_chg = kr_3y.get("value", 0), kr_3y.get("change", 0)
+        kr_10y_v, kr_10y_chg = kr_10y.get("value", 0), kr_10y.get("change", 0)
+        kr_spread_v = _g(ind, "kr_spread").get("value", 0)
+        kr_us_spread_v = _g(ind, "kr_us_spread").get("value", 0)
+        
+        # 미국 금리
+        us2y = _g(ind, "us_2y")
+        us10y = _g(ind, "us_10y")
+        us30y = _g(ind, "us_30y")
+        us2y_v, us2y_pct = us2y.get("value", 0), us2y.get("change_pct", 0)
+        us10y_v, us10y_pct = us10y.get("value", 0), us10y.get("change_pct", 0)
+        us30y_v, us30y_pct = us30y.get("value", 0), us30y.get("change_pct", 0)
+        yield_spread = ind.get("yield_spread", 0)
+        
+        # 통화/변동성
+        dxy = _g(ind, "dxy")
+        usdkrw = _g(ind, "usdkrw")
+        eurusd = _g(ind, "eurusd")
+        usdjpy = _g(ind, "usdjpy")
+        vix = _g(ind, "vix")
+        kospi = _g(ind, "kospi")
+        dxy_v, dxy_wk = dxy.get("value", 0), dxy.get("week_change_pct", 0)
+        usdkrw_v, usdkrw_wk = usdkrw.get("value", 0), usdkrw.get("week_change_pct", 0)
+        eurusd_v, eurusd_wk = eurusd.get("value", 0), eurusd.get("week_change_pct", 0)
+        usdjpy_v, usdjpy_wk = usdjpy.get("value", 0), usdjpy.get("week_change_pct", 0)
+        vix_v, vix_wk = vix.get("value", 0), vix.get("week_change_pct", 0)
+        move_v = _g(ind, "move").get("value", 0)
+        kospi_low, kospi_high = kospi.get("low_1m", 0), kospi.get("high_1m", 0)
+        
+        # 원자재/크립토
+        gold = _g(ind, "gold")
+        oil = _g(ind, "oil")
+        copper = _g(ind, "copper")
+        btc = _g(ind, "btc")
+        gold_v, gold_wk = gold.get("value", 0), gold.get("week_change_pct", 0)
+        oil_v, oil_wk = oil.get("value", 0), oil.get("week_change_pct", 0)
+        copper_v, copper_wk = copper.get("value", 0), copper.get("week_change_pct", 0)
+        btc_v, btc_wk = btc.get("value", 0), btc.get("week_change_pct", 0)
+        
+        # 시그널 계산
+        sig_10y = _get_signal("us_10y", us10y_v)
+        sig_dxy = _get_signal("dxy", dxy_v)
+        sig_vix = _get_signal("vix", vix_v)
+        sig_krw = _get_signal("usdkrw", usdkrw_v)
+        sig_gold = _get_signal("gold", 0, gold_wk)
+        sig_oil = _get_signal("oil", 0, oil_wk)
+        sig_kr_us = _get_signal("kr_us_spread", kr_us_spread_v)
+        
+        values = {
+            # 한국 금리
+            "bok_base_v": bok_base_v, "bok_base_chg": _fmt(bok_base_chg, "%p"),
+            "kr_3y_v": kr_3y_v, "kr_3y_chg": _fmt(kr_3y_chg, "%p"),
+            "kr_10y_v": kr_10y_v, "kr_10y_chg": _fmt(kr_10y_chg, "%p"),
+            "kr_spread_v": kr_spread_v,
+            "kr_spread_state": '<span class="positive">정상</span>' if kr_spread_v > 0 else '<span class="negative">역전</span>',
+            "kr_us_spread_v": kr_us_spread_v,
+            "kr_us_spread_state": '<span class="negative">역전</span>' if kr_us_spread_v < 0 else '<span class="positive">정상</span>',
+            # 미국 금리
+            "us2y_v": us2y_v, "us2y_pct": _fmt(us2y_pct, "%"),
+            "us10y_v": us10y_v, "us10y_pct": _fmt(us10y_pct, "%"),
+            "us30y_v": us30y_v, "us30y_pct": _fmt(us30y_pct, "%"),
+            "yield_spread": yield_spread,
+            "yield_spread_state": '<span class="negative">역전</span>' if yield_spread < 0 else '<span class="positive">정상</span>',
+            # 통화/변동성
+            "dxy_v": dxy_v, "dxy_wk": _fmt(dxy_wk, "%"),
+            "usdkrw_v": usdkrw_v, "usdkrw_wk": _fmt(usdkrw_wk, "%"),
+            "eurusd_v": eurusd_v, "eurusd_wk": _fmt(eurusd_wk, "%"),
+            "usdjpy_v": usdjpy_v, "usdjpy_wk": _fmt(usdjpy_wk, "%"),
+            "vix_v": vix_v, "vix_wk": _fmt(vix_wk, "%"),
+            "move_v": move_v, "kospi_low": kospi_low, "kospi_high": kospi_high,
+            # 원자재/크립토
+            "gold_v": gold_v, "gold_wk": _fmt(gold_wk, "%"),
+            "oil_v": oil_v, "oil_wk": _fmt(oil_wk, "%"),
+            "copper_v": copper_v, "copper_wk": _fmt(copper_wk, "%"),
+            "btc_v": btc_v, "btc_wk": _fmt(btc_wk, "%"),
+        }
+        # 시그널 (해석 텍스트는 템플릿에서 {sig_xxx[1]}로 참조)
+        for key, sig in (("sig_kr_us", sig_kr_us), ("sig_10y", sig_10y), ("sig_dxy", sig_dxy),
+                         ("sig_krw", sig_krw), ("sig_vix", sig_vix), ("sig_gold", sig_gold),
+                         ("sig_oil", sig_oil)):
+            values[key] = sig
+            values[key + "_box"] = _SIG_BOX[sig[0]]
+            values[key + "_class"] = _SIG_CLS.get(sig[0], "")
+        
+        return _MACRO_ANALYSIS_TMPL.format_map(values)
+
+    def _build_cycle_chart(self, claude, ind) -> str:
+        """산업 사이클 차트"""
+        cycle = claude.get("market_cycle", "MID_EXPANSION")
+        cycle_display = cycle.replace("_", " ")
+        rotation = claude.get("rotation_signal", "NEUTRAL")
+        
+        pos = _CYCLE_POSITIONS.get(cycle, _CYCLE_POSITIONS["MID_EXPANSION"])
+        rec_sectors = _CYCLE_SECTORS.get(cycle, "균형 포트폴리오")
+        
+        if "EXPANSION" in cycle:
+            cycle_traits = _CYCLE_TRAITS_EXPANSION
+        elif "CONTRACTION" in cycle or "RECESSION" in cycle:
+            cycle_traits = _CYCLE_TRAITS_CONTRACTION
+        else:
+            cycle_traits = _CYCLE_TRAITS_RECOVERY
+        
+        return _CYCLE_CHART_TMPL.format(
+            x=pos["x"],
+            y=pos["y"],
+            cycle_display=_h(cycle_display),
+            rotation=_h(rotation),
+            rotation_cls=_ROTATION_CLS.get(rotation, "signal-neutral"),
+            rec_sectors=rec_sectors,
+            cycle_traits=cycle_traits,
+        )
+
+    def _build_calendar_section(self, calendar) -> str:
+        us_events = calendar.get("us_events", [])
+        kr_events = calendar.get("kr_events", [])
+        earnings = calendar.get("earnings", [])
+        
+        us_html = "".join(_calendar_event_row(e) for e in us_events[:5])
+        kr_html = "".join(_calendar_event_row(e) for e in kr_events[:5])
+        earn_html = "".join(
+            _CAL_EARNINGS_ROW.format(date=e.get("date", ""), company=_h(e.get("company", "")), market=e.get("market", ""))
+            for e in earnings[:6]
+        )
+        
+        return _CALENDAR_TMPL.format(
+            us_html=us_html or _CAL_NO_EVENTS,
+            kr_html=kr_html or _CAL_NO_EVENTS,
+            earn_html=earn_html or _CAL_NO_EARNINGS,
+        )
+
+    def _build_sector_section(self, kr_sectors, claude) -> str:
+        top_sectors = claude.get("top_sectors", [])
+        avoid_sectors = claude.get("avoid_sectors", [])
+        themes = claude.get("key_themes", [])
+        
+        sector_html = "".join(_sector_perf_row(s) for s in kr_sectors[:12])
+        top_html = "".join(_sector_pick_row(s, 70) for s in top_sectors[:3])
+        avoid_html = "".join(_sector_pick_row(s, 50) for s in avoid_sectors[:2])
+        
+        themes_text = " · ".join(map(_h, themes)) if themes else "-"
+        
+        return _SECTOR_TMPL.format(
+            sector_html=sector_html,
+            top_html=top_html or _EMPTY_TABLE_ROW,
+            avoid_html=avoid_html or _EMPTY_TABLE_ROW,
+            themes_text=themes_text,
+        )
+
+    def _build_quantlib_section(self, quantlib) -> str:
+        if not quantlib:
+            return ""
+        return _QUANTLIB_TMPL.format(v=QuantLibView.from_analysis(quantlib))
+
+    def _build_risk_section(self, risk_m, quantlib) -> str:
+        level = risk_m.get("risk_level", "MEDIUM")
+        score = risk_m.get("risk_score", 50)
+        move = risk_m.get("move_value", 0)
+        vix = risk_m.get("vix_value", 0)
+        vol_mult = risk_m.get("vol_multiplier", 1.0)
+        
+        return _RISK_TMPL.format(
+            level=level, score=score, vix=vix, move=move, vol_mult=vol_mult,
+            commentary=_RISK_COMMENTS[bisect_right(_RISK_COMMENT_EDGES, score)],
+        )
+
+    def _build_recommendation_section(self, alloc, decision) -> str:
+        """투자 추천 섹션"""
+        score = decision.get("score", 50)
+        dec = decision.get("decision", "HOLD")
+        action = decision.get("action", "")
+        signals = decision.get("signals", {})
+        recs = decision.get("recommendations", {})
+        
+        # 자산배분 바 색상
+        colors = {
+            "주식": "#222",
+            "채권": "#666",
+            "현금": "#bbb",
+        }
+        
+        alloc_bar = "".join(
+            f'<div class="allocation-segment" style="width: {pct}%; background: {colors.get(asset, "#999")};"></div>'
+            for asset, pct in alloc.items()
+        )
+        
+        alloc_legend = " · ".join(f"{k} {v}%" for k, v in alloc.items())
+        
+        # 시그널 요약
+        signal_parts = []
+        signal_labels = {
+            "macro": "Macro",
+            "risk": "Risk",
+            "sentiment": "Sentiment",
+            "rotation": "Rotation",
+        }
+        for key, label in signal_labels.items():
+            val = signals.get(key, "N/A")
+            cls = "signal-bullish" if val in ["BULLISH", "LOW", "POSITIVE", "RISK_ON"] else \
+                  "signal-bearish" if val in ["BEARISH", "HIGH", "NEGATIVE", "RISK_OFF"] else "signal-neutral"
+            signal_parts.append(f'<span class="signal-box {cls}" style="margin-right: 8px;">{label}: {_h(val)}</span>')
+        signal_html = "".join(signal_parts)
+        
+        # 결정 색상
+        dec_class = "positive" if dec in ["STRONG_BUY", "BUY"] else "negative" if dec in ["SELL", "REDUCE"] else ""
+        
+        return _RECOMMENDATION_TMPL.format(
+            score=score,
+            dec=dec,
+            dec_class=dec_class,
+            action=action,
+            signal_html=signal_html,
+            alloc_bar=alloc_bar,
+            alloc_legend=alloc_legend,
+            primary_sector=_h(recs.get("primary_sector", "N/A")),
+            position_size=recs.get("position_size", "10%"),
+            catalysts_html="".join(f"<li>{_h(c)}</li>" for c in recs.get("catalysts", [])[:3]) or "<li>-</li>",
+            risk_warning=_RISK_WARNING_HTML if decision.get("risk_warning") else "",
+        )
+
+    def _build_footer(self, ts) -> str:
+        """푸터 섹션"""
+        return _render_footer(ts.strftime(_FMT_GENERATED))
@@ -2,17 +2,55 @@
 RISK Layer - QuantLib 기반 리스크 분석
 정하림 MOVE 모형 + Vasicek + Black-Scholes 통합
 """
+import threading
+import time
+from bisect import bisect_right
 from datetime import datetime
+from math import sqrt
 from typing import Dict
 import numpy as np
 from quantlib_analyzer import QuantLibAnalyzer
 
+# 프로세스 공용 QuantLibAnalyzer (엔진/핸들 및 분석 캐시를 RiskManager 간 공유,
+# 공유 호가 갱신~가격 계산은 분석기 내부 잠금으로 직렬화)
+_QL_ANALYZER = None
+_QL_LOCK = threading.Lock()
+
+
+def _get_ql_analyzer() -> QuantLibAnalyzer:
+    global _QL_ANALYZER
+    if _QL_ANALYZER is None:
+        with _QL_LOCK:
+            if _QL_ANALYZER is None:
+                _QL_ANALYZER = QuantLibAnalyzer()
+    return _QL_ANALYZER
+
+
+# MOVE/VIX 기준점 구간별 기여도 (low 미만, medium 미만, high 미만, extreme 미만, 그 이상)
+_COMPONENT_SCORES = (10, 25, 35, 45, 50)
+
+# 종합 리스크 점수 → 리스크 레벨
+_RISK_LEVEL_EDGES = (40, 60, 80)
+_RISK_LEVELS = ("LOW", "MEDIUM", "HIGH", "EXTREME")
+
+# VIX(연간화 %) → 일간 변동성 환산 계수, 보유기간 배수
+_DAILY_NORM = 1.0 / (100.0 * sqrt(252))
+_SQRT5 = sqrt(5)
+_SQRT20 = sqrt(20)
+
 
 class RiskManager:
     """QuantLib 기반 리스크 관리"""
     
+    # 신뢰수준별 정규분포 z-score
+    _Z_CONFIDENCE = (0.90, 0.95, 0.99)
+    _Z_SCORES = (1.28, 1.645, 2.33)
+    
+    # 1일 VaR 대비 배수: 1일, 5일(√5), 20일(√20), Expected Shortfall 근사(1.25, 정규분포 가정)
+    _HORIZON_MULT = np.array([1.0, _SQRT5, _SQRT20, 1.25])
+    
     def __init__(self):
-        self.ql_analyzer = QuantLibAnalyzer()
+        self.ql_analyzer = _get_ql_analyzer()
         
         # MOVE 지수 기준점
         self.move_thresholds = {
@@ -29,6 +67,10 @@ class RiskManager:
             "high": 25,
             "extreme": 35,
         }
+        
+        # 구간 탐색용 정렬된 경계값 (low < medium < high < extreme)
+        self._move_edges = tuple(self.move_thresholds.values())
+        self._vix_edges = tuple(self.vix_thresholds.values())
     
     def analyze(self, move_value: float, vix_value: float, 
                 portfolio_value: float, market_data: Dict = None) -> Dict:
@@ -65,8 +107,10 @@ class RiskManager:
         # VaR 계산
         var_analysis = self._calculate_var(portfolio_value, vix_value)
         
+        ts_ns = time.time_ns()
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.fromtimestamp(ts_ns / 1e9).isoformat(),
+            "ts_ns": ts_ns,
             "risk_metrics": risk_metrics,
             "position_sizing": position_sizing,
             "var_analysis": var_analysis,
@@ -75,42 +119,15 @@ class RiskManager:
 
     def _calculate_risk_metrics(self, move: float, vix: float) -> Dict:
         """리스크 메트릭 계산"""
-        # MOVE 기여도 (0-50점)
-        if move < self.move_thresholds["low"]:
-            move_score = 10
-        elif move < self.move_thresholds["medium"]:
-            move_score = 25
-        elif move < self.move_thresholds["high"]:
-            move_score = 35
-        elif move < self.move_thresholds["extreme"]:
-            move_score = 45
-        else:
-            move_score = 50
-        
-        # VIX 기여도 (0-50점)
-        if vix < self.vix_thresholds["low"]:
-            vix_score = 10
-        elif vix < self.vix_thresholds["medium"]:
-            vix_score = 25
-        elif vix < self.vix_thresholds["high"]:
-            vix_score = 35
-        elif vix < self.vix_thresholds["extreme"]:
-            vix_score = 45
-        else:
-            vix_score = 50
+        # MOVE/VIX 기여도 (각 0-50점) - 기준점 구간 이진 탐색
+        move_score = _COMPONENT_SCORES[bisect_right(self._move_edges, move)]
+        vix_score = _COMPONENT_SCORES[bisect_right(self._vix_edges, vix)]
         
         # 종합 리스크 점수
         risk_score = move_score + vix_score
         
         # 리스크 레벨
-        if risk_score < 40:
-            risk_level = "LOW"
-        elif risk_score < 60:
-            risk_level = "MEDIUM"
-        elif risk_score < 80:
-            risk_level = "HIGH"
-        else:
-            risk_level = "EXTREME"
+        risk_level = _RISK_LEVELS[bisect_right(_RISK_LEVEL_EDGES, risk_score)]
         
         # 변동성 배수 (정규화)
         vol_multiplier = (vix / 20) * (move / 100)
@@ -125,6 +142,33 @@ class RiskManager:
             "vix_value": vix,
         }
     
+    def risk_metrics_batch(self, move_values: np.ndarray, vix_values: np.ndarray) -> Dict:
+        """
+        리스크 메트릭 일괄 계산 (일별 MOVE/VIX 시계열 등)
+        
+        Args:
+            move_values, vix_values: 시점별 MOVE/VIX (브로드캐스트 가능)
+        
+        Returns:
+            항목별 배열 - _calculate_risk_metrics와 같은 구간 규칙
+        """
+        move_values, vix_values = np.broadcast_arrays(
+            np.asarray(move_values, dtype=float), np.asarray(vix_values, dtype=float)
+        )
+        scores = np.array(_COMPONENT_SCORES)
+        move_scores = scores[np.searchsorted(self._move_edges, move_values, side="right")]
+        vix_scores = scores[np.searchsorted(self._vix_edges, vix_values, side="right")]
+        risk_scores = move_scores + vix_scores
+        levels = np.array(_RISK_LEVELS)[np.searchsorted(_RISK_LEVEL_EDGES, risk_scores, side="right")]
+        
+        return {
+            "risk_level": levels,
+            "risk_score": risk_scores,
+            "move_contribution": move_scores,
+            "vix_contribution": vix_scores,
+            "vol_multiplier": np.round((vix_values / 20) * (move_values / 100), 3),
+        }
+    
     def _calculate_position_sizing(self, risk_score: float, 
                                     portfolio_value: float) -> Dict:
         """리스크 기반 포지션 사이징"""
@@ -165,19 +209,13 @@ class RiskManager:
                        confidence: float = 0.95) -> Dict:
         """Value at Risk 계산"""
         # 일간 변동성 추정 (VIX는 연간화된 값)
-        daily_vol = vix / 100 / np.sqrt(252)
-        
-        # 정규분포 가정 VaR
-        z_score = {0.90: 1.28, 0.95: 1.645, 0.99: 2.33}
-        z = z_score.get(confidence, 1.645)
+        daily_vol = vix * _DAILY_NORM
         
-        var_1d = portfolio_value * daily_vol * z
-        var_5d = var_1d * np.sqrt(5)
-        var_20d = var_1d * np.sqrt(20)
+        # 정규분포 가정 VaR (표의 신뢰수준 사이는 선형 보간)
+        z = np.interp(confidence, self._Z_CONFIDENCE, self._Z_SCORES)
         
-        # Expected Shortfall (CVaR) 근사
-        es_multiplier = 1.25  # 정규분포 가정
-        cvar_1d = var_1d * es_multiplier
+        # 1일/5일/20일 VaR, CVaR를 한 번의 브로드캐스트로
+        var_1d, var_5d, var_20d, cvar_1d = map(float, (portfolio_value * daily_vol * z) * self._HORIZON_MULT)
         
         return {
             "confidence_level": confidence,
@@ -188,6 +226,13 @@ class RiskManager:
             "cvar_1d": round(cvar_1d, 0),
             "interpretation": f"{confidence*100:.0f}% 신뢰수준에서 1일 최대 손실 {var_1d:,.0f}원",
         }
+    
+    def _calculate_var_vec(self, portfolio_value: float, vix_arr: np.ndarray,
+                           confidence: float = 0.95) -> np.ndarray:
+        """VIX 시계열 일괄 VaR - (len(vix_arr), 4) 배열 (열: 1일/5일/20일 VaR, 1일 CVaR)"""
+        z = np.interp(confidence, self._Z_CONFIDENCE, self._Z_SCORES)
+        base = np.asarray(vix_arr, dtype=float).reshape(-1, 1) * (portfolio_value * _DAILY_NORM * z)
+        return base * self._HORIZON_MULT
 
 
 if __name__ == "__main__":
@@ -204,5 +249,5 @@ if __name__ == "__main__":
         }
     )
     
-    import json
-    print(json.dumps(result, indent=2, ensure_ascii=False))
+    from json_utils import dumps
+    print(dumps(result))
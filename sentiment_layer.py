@@ -1,12 +1,28 @@
 """
 SENTIMENT Layer - 빅카인즈 뉴스 + Claude 감성 분석
 """
+import re
+import time
 import requests
-import json
 from datetime import datetime, timedelta
-from typing import Dict, List
-import anthropic
+from functools import cached_property
+from typing import Dict, List, Union
 from config import BIGKINDS_KEY, CLAUDE_API_KEY
+from json_utils import dumps, loads, parse_json_response
+
+try:
+    import anthropic
+except ImportError:
+    anthropic = None
+
+# 기본 분석용 긍정/부정 키워드 (서로 겹치는 부분 문자열 없음 → 교대 패턴 한 번으로 검색)
+_POS_WORDS = ("상승", "호재", "성장", "개선", "회복", "강세", "매수", "기대", "돌파", "신고가")
+_NEG_WORDS = ("하락", "악재", "위기", "우려", "침체", "약세", "매도", "불안", "급락", "손실")
+_POS_RE = re.compile("|".join(map(re.escape, _POS_WORDS)))
+_NEG_RE = re.compile("|".join(map(re.escape, _NEG_WORDS)))
+
+# 빅카인즈 요청 공용 세션 (요청마다 TCP/TLS 연결을 새로 맺지 않음)
+_SESSION = requests.Session()
 
 
 class SentimentAnalyzer:
@@ -14,21 +30,36 @@ class SentimentAnalyzer:
     
     def __init__(self):
         self.bigkinds_url = "https://tools.kinds.or.kr:8443/search/news"
-        self.claude = anthropic.Anthropic(api_key=CLAUDE_API_KEY) if CLAUDE_API_KEY else None
     
-    def fetch_bigkinds(self, keyword: str, days: int = 3) -> List[Dict]:
-        """빅카인즈 API 뉴스 검색"""
+    @cached_property
+    def claude(self):
+        """Claude 클라이언트 - 실제로 분석할 때 처음 생성"""
+        if anthropic is None or not CLAUDE_API_KEY:
+            return None
+        return anthropic.Anthropic(api_key=CLAUDE_API_KEY)
+    
+    def fetch_bigkinds(self, keywords: Union[str, List[str]], days: int = 3) -> List[Dict]:
+        """
+        빅카인즈 API 뉴스 검색
+        
+        Args:
+            keywords: 검색어 또는 검색어 목록 (목록은 OR 쿼리 한 번으로 요청)
+            days: 최근 조회 일수
+        """
         if not BIGKINDS_KEY:
             print("    ⚠️ 빅카인즈 API 키 없음")
             return []
         
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
         
         payload = {
             "access_key": BIGKINDS_KEY,
             "argument": {
-                "query": keyword,
+                "query": " OR ".join(keywords),
                 "published_at": {
                     "from": start_date.strftime("%Y-%m-%d"),
                     "until": end_date.strftime("%Y-%m-%d")
@@ -37,19 +68,19 @@ class SentimentAnalyzer:
                 "category": ["경제", "IT_과학"],
                 "sort": {"date": "desc"},
                 "return_from": 0,
-                "return_size": 10,
+                "return_size": min(50, 10 * len(keywords)),
                 "fields": ["title", "content", "published_at", "provider", "category"]
             }
         }
         
         try:
-            response = requests.post(
+            response = _SESSION.post(
                 self.bigkinds_url,
                 json=payload,
                 headers={"Content-Type": "application/json"},
                 timeout=15
             )
-            data = response.json()
+            data = loads(response.content)
             
             if data.get("result") == 0:
                 docs = data.get("return_object", {}).get("documents", [])
@@ -100,13 +131,7 @@ JSON 형식으로 응답:
             )
             
             text = msg.content[0].text
-            if "```" in text:
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-                text = text.split("```")[0]
-            
-            result = json.loads(text.strip())
+            result = parse_json_response(text)
             result["source"] = "claude"
             return result
         except Exception as e:
@@ -115,14 +140,12 @@ JSON 형식으로 응답:
     
     def _basic_analysis(self, news_list: List[Dict]) -> Dict:
         """기본 키워드 기반 분석"""
-        pos_words = ["상승", "호재", "성장", "개선", "회복", "강세", "매수", "기대", "돌파", "신고가"]
-        neg_words = ["하락", "악재", "위기", "우려", "침체", "약세", "매도", "불안", "급락", "손실"]
-        
+        # 기사별로 등장한 서로 다른 키워드 수 (한 번의 정규식 스캔)
         pos, neg = 0, 0
         for n in news_list:
             text = n["title"] + " " + n["content"]
-            pos += sum(1 for w in pos_words if w in text)
-            neg += sum(1 for w in neg_words if w in text)
+            pos += len(set(_POS_RE.findall(text)))
+            neg += len(set(_NEG_RE.findall(text)))
         
         if pos > neg * 1.5:
             sentiment = "POSITIVE"
@@ -152,26 +175,24 @@ JSON 형식으로 응답:
             keywords = ["증시", "코스피", "반도체", "금리", "환율"]
         
         print("    → 빅카인즈 뉴스 수집 중...")
-        all_news = []
-        for kw in keywords:
-            news = self.fetch_bigkinds(kw, days=3)
-            all_news.extend(news)
+        # 키워드 전체를 OR 쿼리 한 번으로 요청 (키워드별 왕복 제거)
+        all_news = self.fetch_bigkinds(keywords, days=3) if keywords else []
         
-        # 중복 제거
-        seen = set()
-        unique = []
+        # 중복 제거 (제목 기준, 처음 나온 기사 유지 - dict 삽입 순서 보존)
+        by_title = {}
         for n in all_news:
-            if n["title"] not in seen:
-                seen.add(n["title"])
-                unique.append(n)
+            by_title.setdefault(n["title"], n)
+        unique = list(by_title.values())
         
         print(f"    → {len(unique)}개 뉴스 수집 완료")
         print("    → Claude 감성 분석 중...")
         
         sentiment = self.analyze_with_claude(unique[:10])
         
+        ts_ns = time.time_ns()
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.fromtimestamp(ts_ns / 1e9).isoformat(),
+            "ts_ns": ts_ns,
             "keywords": keywords,
             "news_count": len(unique),
             "news_sample": unique[:5],
@@ -182,4 +203,4 @@ JSON 형식으로 응답:
 if __name__ == "__main__":
     analyzer = SentimentAnalyzer()
     result = analyzer.analyze()
-    print(json.dumps(result, indent=2, ensure_ascii=False))
\ No newline at end of file
+    print(dumps(result))
\ No newline at end of file
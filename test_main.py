@@ -0,0 +1,48 @@
+"""
+main - 최종 투자 판단 결과 형태 테스트
+"""
+import json
+import os
+import tempfile
+import unittest
+from main import InvestmentAdvisor
+
+
+def _analysis(macro="BULLISH", risk_level="LOW", sentiment="POSITIVE"):
+    return {
+        "macro": {"overall": macro},
+        "risk": {
+            "risk_metrics": {"risk_level": risk_level, "risk_score": 35},
+            "position_sizing": {"adjusted_allocation": 0.6},
+        },
+        "sentiment": {"sentiment": {"overall_sentiment": sentiment}},
+        "industry": {"claude_analysis": {"top_sectors": [{"name": "반도체", "catalysts": ["HBM"]}]}},
+    }
+
+
+class MakeDecisionTest(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.advisor = InvestmentAdvisor()
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_decision_is_json_serializable(self):
+        decision = self.advisor.make_decision(_analysis())
+        self.assertIsInstance(decision["allocation"], dict)
+        json.dumps(decision, ensure_ascii=False)
+
+    def test_allocation_mutation_does_not_leak(self):
+        first = self.advisor.make_decision(_analysis())
+        expected = dict(first["allocation"])
+        first["allocation"]["주식"] = 0
+        second = self.advisor.make_decision(_analysis())
+        self.assertEqual(second["allocation"], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
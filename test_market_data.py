@@ -0,0 +1,43 @@
+"""
+market_data - yfinance 배치 다운로드 컬럼 형태 처리 테스트
+"""
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+import market_data
+
+_INDEX = pd.bdate_range("2026-01-05", periods=5)
+_FRAME = pd.DataFrame({"Open": np.arange(5.0), "Close": np.arange(5.0) + 1}, index=_INDEX)
+
+
+class DownloadHistoryTest(unittest.TestCase):
+    def _download(self, data, tickers):
+        with mock.patch.object(market_data.yf, "download", return_value=data):
+            return market_data.download_history(tickers, use_cache=False)
+
+    def test_single_ticker_flat_columns(self):
+        # 구버전 yfinance: 단일 티커는 필드 컬럼만 반환
+        hist = self._download(_FRAME, ["AAPL"])["AAPL"]
+        pd.testing.assert_frame_equal(hist, _FRAME)
+
+    def test_multi_ticker_columns(self):
+        data = pd.concat({"A": _FRAME, "B": _FRAME}, axis=1)
+        histories = self._download(data, ["A", "B", "C"])
+        pd.testing.assert_frame_equal(histories["A"], _FRAME)
+        pd.testing.assert_frame_equal(histories["B"], _FRAME)
+        self.assertTrue(histories["C"].empty)
+
+    def test_failed_download_not_cached(self):
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(market_data, "CACHE_DIR", tmp):
+            with mock.patch.object(market_data.yf, "download", side_effect=OSError):
+                histories = market_data.download_history(["AAPL"])
+            self.assertTrue(histories["AAPL"].empty)
+            with mock.patch.object(market_data.yf, "download", return_value=_FRAME):
+                hist = market_data.download_history(["AAPL"])["AAPL"]
+            pd.testing.assert_frame_equal(hist, _FRAME)
+
+
+if __name__ == "__main__":
+    unittest.main()
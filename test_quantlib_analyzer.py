@@ -0,0 +1,112 @@
+"""
+quantlib_analyzer - 종합 분석 캐시 및 일괄 API 테스트
+"""
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+import numpy as np
+import quantlib_analyzer
+from quantlib_analyzer import QuantLibAnalyzer
+
+MARKET_DATA = {"us_10y": 0.0427, "us_2y": 0.0359, "us_30y": 0.045, "vix": 18.0, "kospi": 2650}
+
+
+class ComprehensiveCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.qa = QuantLibAnalyzer()
+
+    def test_cache_hit_returns_copy(self):
+        first = self.qa.comprehensive_analysis(MARKET_DATA)
+        first["vasicek"]["parameters"]["r0"] = -1
+        second = self.qa.comprehensive_analysis(MARKET_DATA)
+        self.assertEqual(len(self.qa._analysis_cache), 1)
+        self.assertNotEqual(second["vasicek"]["parameters"]["r0"], -1)
+
+    def test_cache_is_per_instance(self):
+        self.qa.comprehensive_analysis(MARKET_DATA)
+        self.assertEqual(len(QuantLibAnalyzer()._analysis_cache), 0)
+
+    def test_cache_key_includes_evaluation_date(self):
+        self.qa.comprehensive_analysis(MARKET_DATA)
+        tomorrow = date.today() + timedelta(days=1)
+        with mock.patch.object(quantlib_analyzer, "date") as fake_date:
+            fake_date.today.return_value = tomorrow
+            self.qa.comprehensive_analysis(MARKET_DATA)
+        self.assertEqual({key[0] for key in self.qa._analysis_cache}, {date.today(), tomorrow})
+
+    def test_cache_evicts_least_recently_used(self):
+        with mock.patch.object(QuantLibAnalyzer, "_ANALYSIS_CACHE_SIZE", 2):
+            for vix in (15.0, 20.0, 15.0, 25.0):
+                self.qa.comprehensive_analysis({**MARKET_DATA, "vix": vix})
+        vixes = [dict(key[1])["vix"] for key in self.qa._analysis_cache]
+        self.assertEqual(vixes, [15.0, 25.0])
+
+    def test_engine_rebuilt_after_date_change(self):
+        if not self.qa._engine_ready():
+            self.skipTest("QuantLib 미설치")
+        today = self.qa.today
+        engine = self.qa._engine
+        self.assertTrue(self.qa._engine_ready())
+        self.assertIs(self.qa._engine, engine)
+
+        # 어제 만든 엔진이면 오늘 평가일로 다시 생성
+        self.qa.today = today - 1
+        self.assertTrue(self.qa._engine_ready())
+        self.assertEqual(self.qa.today, today)
+        self.assertIsNot(self.qa._engine, engine)
+
+
+class BatchParityTest(unittest.TestCase):
+    def setUp(self):
+        self.qa = QuantLibAnalyzer()
+
+    def test_yield_curve_batch_matches_single(self):
+        # 정렬되지 않은 기간 입력, 정상/역전/평탄 곡선
+        tenors = np.array([[10.0, 0.25, 2.0, 30.0]] * 3)
+        yields = np.array([
+            [0.0427, 0.0450, 0.0359, 0.0450],
+            [0.0350, 0.0500, 0.0450, 0.0340],
+            [0.0400, 0.0401, 0.0400, 0.0402],
+        ])
+        batch = self.qa.yield_curve_analysis_batch(tenors, yields)
+        self.assertEqual(batch["scenarios"], 3)
+        for k in range(3):
+            single = self.qa.yield_curve_analysis((tenors[k], yields[k]))
+            self.assertEqual(batch["curve_shape"][k], single["curve_shape"])
+            self.assertAlmostEqual(round(batch["slope_bps"][k], 1), single["slope_bps"])
+            self.assertAlmostEqual(round(batch["short_rate"][k], 3), single["short_rate"])
+            self.assertAlmostEqual(round(batch["long_rate"][k], 3), single["long_rate"])
+            np.testing.assert_allclose(
+                np.round(batch["forward_rates"][k], 3), list(single["forward_rates"].values())
+            )
+
+    def test_black_scholes_batch_matches_single(self):
+        if not self.qa._engine_ready():
+            self.skipTest("QuantLib 미설치")
+        spots = np.array([90.0, 100.0, 110.0, 100.0])
+        strikes = np.array([100.0, 100.0, 100.0, 120.0])
+        vols = np.array([0.15, 0.20, 0.25, 0.30])
+        rates = np.array([0.03, 0.035, 0.04, 0.045])
+        maturities = np.array([30, 60, 90, 365])
+        for option_type in ("call", "put"):
+            batch = self.qa.black_scholes_batch(spots, strikes, vols, rates, maturities, option_type)
+            for i in range(spots.size):
+                single = self.qa.black_scholes_analysis(
+                    spots[i], strikes[i], rates[i], vols[i], int(maturities[i]), option_type
+                )
+                self.assertAlmostEqual(round(batch[i], 4), single["price"])
+
+    def test_black_scholes_batch_broadcasts_scalars(self):
+        if not self.qa._engine_ready():
+            self.skipTest("QuantLib 미설치")
+        batch = self.qa.black_scholes_batch(np.array([95.0, 105.0]), 100.0, 0.2, 0.03, 30)
+        self.assertEqual(batch.shape, (2,))
+        self.assertLess(batch[0], batch[1])
+
+    def test_yield_curve_batch_rejects_bad_shape(self):
+        self.assertIn("error", self.qa.yield_curve_analysis_batch(np.ones((2, 1)), np.ones((2, 1))))
+        self.assertIn("error", self.qa.yield_curve_analysis_batch(np.ones((2, 3)), np.ones((2, 4))))
+
+
+if __name__ == "__main__":
+    unittest.main()
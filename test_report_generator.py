@@ -0,0 +1,134 @@
+"""
+report_generator - 외부 텍스트(Claude/뉴스 응답) HTML 이스케이프 및 본문 캐시 테스트
+"""
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+import report_generator
+from report_generator import ReportGenerator
+
+PAYLOAD = "<script>alert(1)</script>"
+ESCAPED = "&lt;script&gt;alert(1)&lt;/script&gt;"
+
+
+class ReportEscapingTest(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.gen = ReportGenerator()
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def _claude(self):
+        return {
+            "market_cycle": PAYLOAD,
+            "rotation_signal": PAYLOAD,
+            "cycle_reasoning": PAYLOAD,
+            "trading_idea": PAYLOAD,
+            "policy_impact": PAYLOAD,
+            "top_sectors": [{"name": PAYLOAD, "score": PAYLOAD, "reasoning": PAYLOAD}],
+            "avoid_sectors": [{"name": PAYLOAD, "score": PAYLOAD, "reasoning": PAYLOAD}],
+            "key_themes": [PAYLOAD],
+        }
+
+    def assertEscaped(self, html):
+        self.assertNotIn("<script>", html)
+        self.assertIn(ESCAPED, html)
+
+    def test_executive_summary(self):
+        self.assertEscaped(self.gen._build_executive_summary({}, self._claude(), {}))
+
+    def test_cycle_chart(self):
+        self.assertEscaped(self.gen._build_cycle_chart(self._claude(), {}))
+
+    def test_sector_section(self):
+        kr_sectors = [{"name": PAYLOAD, "perf_month": 1.0}]
+        self.assertEscaped(self.gen._build_sector_section(kr_sectors, self._claude()))
+
+    def test_calendar_section(self):
+        calendar = {
+            "us_events": [{"date": "01/01", "event": PAYLOAD, "importance": "HIGH"}],
+            "earnings": [{"date": "01/02", "company": PAYLOAD, "market": "US"}],
+        }
+        self.assertEscaped(self.gen._build_calendar_section(calendar))
+
+    def test_recommendation_section(self):
+        decision = {
+            "signals": {"sentiment": PAYLOAD, "rotation": PAYLOAD},
+            "recommendations": {"primary_sector": PAYLOAD, "catalysts": [PAYLOAD]},
+        }
+        self.assertEscaped(self.gen._build_recommendation_section({"주식": 50}, decision))
+
+    def test_full_report(self):
+        analysis = {
+            "macro": {},
+            "industry": {"claude_analysis": self._claude()},
+            "risk": {},
+            "sentiment": {},
+        }
+        decision = {"signals": {"sentiment": PAYLOAD}}
+        html = self.gen.generate_html_report(analysis, decision, 1e8)
+        self.assertEscaped(html)
+
+
+class ReportCacheTest(unittest.TestCase):
+    ANALYSIS = {"macro": {}, "industry": {}, "risk": {}, "sentiment": {}}
+    DECISION = {"score": 60, "decision": "BUY"}
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.gen = ReportGenerator()
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def _cache_files(self):
+        return sorted(os.listdir(self.gen.cache_dir))
+
+    def test_cache_hit_reuses_body_only(self):
+        first = self.gen.generate_html_parts(self.ANALYSIS, self.DECISION, 1e8)
+        second = self.gen.generate_html_parts(self.ANALYSIS, self.DECISION, 1e8)
+        self.assertEqual(len(self._cache_files()), 1)
+        # 스타일/머리말 + 캐시된 본문 + 푸터
+        self.assertEqual(len(second), 4)
+        self.assertEqual("".join(first[2:-1]), second[2])
+
+    def test_render_version_in_key(self):
+        self.gen.generate_html_parts(self.ANALYSIS, self.DECISION, 1e8)
+        with mock.patch.object(report_generator, "_RENDER_VERSION", "changed"):
+            parts = self.gen.generate_html_parts(self.ANALYSIS, self.DECISION, 1e8)
+        self.assertEqual(len(self._cache_files()), 2)
+        self.assertGreater(len(parts), 4)
+
+    def test_prune_expired_and_extra_entries(self):
+        os.makedirs(self.gen.cache_dir)
+        now = time.time()
+        for i in range(report_generator.REPORT_CACHE_SIZE + 5):
+            path = os.path.join(self.gen.cache_dir, f"{i:04d}.body.html")
+            with open(path, "w") as f:
+                f.write("x")
+            os.utime(path, (now - i, now - i))
+        expired = os.path.join(self.gen.cache_dir, "expired.body.html")
+        with open(expired, "w") as f:
+            f.write("x")
+        old = now - report_generator.REPORT_CACHE_TTL - 1
+        os.utime(expired, (old, old))
+
+        self.gen.generate_html_parts(self.ANALYSIS, self.DECISION, 1e8)
+        files = self._cache_files()
+        self.assertEqual(len(files), report_generator.REPORT_CACHE_SIZE)
+        self.assertNotIn("expired.body.html", files)
+        # 새로 저장한 항목은 남고 가장 오래된 항목부터 제거
+        self.assertNotIn(f"{report_generator.REPORT_CACHE_SIZE + 4:04d}.body.html", files)
+
+
+if __name__ == "__main__":
+    unittest.main()
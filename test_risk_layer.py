@@ -0,0 +1,51 @@
+"""
+risk_layer - VaR 결과 타입 및 리스크 메트릭 일괄 계산 테스트
+"""
+import itertools
+import unittest
+import numpy as np
+from risk_layer import RiskManager
+
+
+class CalculateVarTest(unittest.TestCase):
+    def setUp(self):
+        self.rm = RiskManager()
+
+    def test_values_are_builtin_floats(self):
+        for confidence in (0.90, 0.95, 0.97, 0.99):
+            var = self.rm._calculate_var(1e8, 18.0, confidence)
+            for key in ("daily_volatility", "var_1d", "var_5d", "var_20d", "cvar_1d"):
+                self.assertIs(type(var[key]), float, key)
+
+    def test_horizon_scaling(self):
+        var = self.rm._calculate_var(1e8, 20.0)
+        self.assertAlmostEqual(var["var_5d"], round(var["var_1d"] * 5 ** 0.5, 0), delta=1)
+        self.assertAlmostEqual(var["var_20d"], round(var["var_1d"] * 20 ** 0.5, 0), delta=1)
+        self.assertAlmostEqual(var["cvar_1d"], round(var["var_1d"] * 1.25, 0), delta=1)
+
+
+class RiskMetricsBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.rm = RiskManager()
+
+    def test_batch_matches_scalar_at_boundaries(self):
+        # 각 기준점과 그 바로 아래/위 값 (경계값은 상위 구간)
+        moves = sorted({v + d for v in self.rm._move_edges for d in (-1e-9, 0.0, 1e-9)} | {0.0, 200.0})
+        vixes = sorted({v + d for v in self.rm._vix_edges for d in (-1e-9, 0.0, 1e-9)} | {0.0, 60.0})
+        pairs = list(itertools.product(moves, vixes))
+        batch = self.rm.risk_metrics_batch(
+            np.array([m for m, _ in pairs]), np.array([v for _, v in pairs])
+        )
+        for i, (move, vix) in enumerate(pairs):
+            single = self.rm._calculate_risk_metrics(move, vix)
+            for key in ("risk_level", "risk_score", "move_contribution", "vix_contribution", "vol_multiplier"):
+                self.assertEqual(batch[key][i], single[key], (key, move, vix))
+
+    def test_batch_broadcasts_scalar(self):
+        batch = self.rm.risk_metrics_batch(np.array([70.0, 100.0, 160.0]), 20.0)
+        self.assertEqual(batch["risk_score"].shape, (3,))
+        self.assertEqual(batch["vix_contribution"].tolist(), [35, 35, 35])
+
+
+if __name__ == "__main__":
+    unittest.main()